@@ -6,44 +6,63 @@ This script demonstrates the functionality of the BillingAgent and
 InsuranceReimbursementAgent for EneHealths mental health services.
 """
 
+import operator
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 from src.agents.billing_agent import BillingAgent
 from src.agents.insurance_agent import InsuranceReimbursementAgent
 
+# Bound formatters for the money and percentage values shown by the demos
+_money = "${:.2f}".format
+_pct = "{:.1f}%".format
+
+
+def split_payment_portions(total_costs, coverage_percentages, patient_responsibilities):
+    """Split parallel per-service sequences into (insurance, patient) portions"""
+    insurance_portions = tuple(map(operator.mul, total_costs, coverage_percentages))
+    patient_portions = tuple(map(operator.mul, total_costs, patient_responsibilities))
+    return insurance_portions, patient_portions
+
 
-def demonstrate_billing_agent():
+def demonstrate_billing_agent(billing_agent=None, write=None):
     """Demonstrate BillingAgent functionality"""
-    print("\n=== BILLING AGENT DEMO ===\n")
+    # Collect the section output and write it in one call at the end,
+    # through write when the caller supplies one
+    out = []
+    out.append("\n=== BILLING AGENT DEMO ===\n")
     
-    # Initialize the billing agent
-    billing_agent = BillingAgent()
-    print("Billing Agent initialized with default CPT codes")
+    # Initialize the billing agent unless one was provided
+    if billing_agent is None:
+        billing_agent = BillingAgent()
+    out.append("Billing Agent initialized with default CPT codes")
     
     # Verify CPT codes
-    print("\n--- CPT Code Verification ---")
+    out.append("\n--- CPT Code Verification ---")
     valid_code = "90834"  # 45-minute psychotherapy
     invalid_code = "99999"
     
     is_valid, code_details = billing_agent.verify_cpt_code(valid_code)
-    print(f"CPT Code {valid_code} valid: {is_valid}")
+    out.append(f"CPT Code {valid_code} valid: {is_valid}")
     if is_valid:
-        print(f"Description: {code_details['description']}")
-        print(f"Rate: ${code_details['rate']:.2f}")
-        print(f"Duration: {code_details['duration_minutes']} minutes")
+        out.append(f"Description: {code_details['description']}")
+        out.append(f"Rate: {_money(code_details['rate'])}")
+        out.append(f"Duration: {code_details['duration_minutes']} minutes")
     
     is_valid, _ = billing_agent.verify_cpt_code(invalid_code)
-    print(f"CPT Code {invalid_code} valid: {is_valid}")
+    out.append(f"CPT Code {invalid_code} valid: {is_valid}")
     
     # Calculate service cost
-    print("\n--- Service Cost Calculation ---")
+    out.append("\n--- Service Cost Calculation ---")
     service_cost = billing_agent.calculate_service_cost("90837", units=1)
-    print(f"Service: {service_cost['service']}")
-    print(f"Base Rate: ${service_cost['base_rate']:.2f}")
-    print(f"Units: {service_cost['units']}")
-    print(f"Total Cost: ${service_cost['total_cost']:.2f}")
-    print(f"Duration: {service_cost['duration_minutes']} minutes")
+    out.append(f"Service: {service_cost['service']}")
+    out.append(f"Base Rate: {_money(service_cost['base_rate'])}")
+    out.append(f"Units: {service_cost['units']}")
+    out.append(f"Total Cost: {_money(service_cost['total_cost'])}")
+    out.append(f"Duration: {service_cost['duration_minutes']} minutes")
     
     # Process payment
-    print("\n--- Payment Processing ---")
+    out.append("\n--- Payment Processing ---")
     patient_id = "PT12345"
     payment = billing_agent.process_payment(
         patient_id=patient_id,
@@ -52,16 +71,16 @@ def demonstrate_billing_agent():
         service_details=service_cost
     )
     
-    print(f"Payment successful: {payment['success']}")
-    print(f"Transaction ID: {payment['transaction_id']}")
-    print(f"Amount: ${payment['amount']:.2f}")
+    out.append(f"Payment successful: {payment['success']}")
+    out.append(f"Transaction ID: {payment['transaction_id']}")
+    out.append(f"Amount: {_money(payment['amount'])}")
     
     # Generate invoice
-    print("\n--- Invoice Generation ---")
-    services = [
+    out.append("\n--- Invoice Generation ---")
+    services = (
         billing_agent.calculate_service_cost("90791"),  # Diagnostic evaluation
-        billing_agent.calculate_service_cost("90837")   # 60-minute therapy
-    ]
+        service_cost                                    # 60-minute therapy
+    )
     
     invoice = billing_agent.generate_invoice(
         patient_id=patient_id,
@@ -69,33 +88,37 @@ def demonstrate_billing_agent():
         payment_status="unpaid"
     )
     
-    print(f"Invoice ID: {invoice['invoice_id']}")
-    print(f"Patient ID: {invoice['patient_id']}")
-    print(f"Total Amount: ${invoice['total_amount']:.2f}")
-    print(f"Issue Date: {invoice['issue_date']}")
-    print(f"Due Date: {invoice['due_date']}")
-    print(f"Payment Status: {invoice['payment_status']}")
+    out.append(f"Invoice ID: {invoice['invoice_id']}")
+    out.append(f"Patient ID: {invoice['patient_id']}")
+    out.append(f"Total Amount: {_money(invoice['total_amount'])}")
+    out.append(f"Issue Date: {invoice['issue_date']}")
+    out.append(f"Due Date: {invoice['due_date']}")
+    out.append(f"Payment Status: {invoice['payment_status']}")
     
     # Get patient billing history
-    print("\n--- Patient Billing History ---")
+    out.append("\n--- Patient Billing History ---")
     history = billing_agent.get_patient_billing_history(patient_id)
-    print(f"Patient ID: {history['patient_id']}")
-    print(f"Total Paid: ${history['total_paid']:.2f}")
-    print(f"Outstanding Balance: ${history['outstanding_balance']:.2f}")
-    print(f"Number of Transactions: {len(history['transactions'])}")
-    print(f"Number of Invoices: {len(history['invoices'])}")
+    out.append(f"Patient ID: {history['patient_id']}")
+    out.append(f"Total Paid: {_money(history['total_paid'])}")
+    out.append(f"Outstanding Balance: {_money(history['outstanding_balance'])}")
+    out.append(f"Number of Transactions: {len(history['transactions'])}")
+    out.append(f"Number of Invoices: {len(history['invoices'])}")
+    
+    (write or sys.stdout.write)("\n".join(out) + "\n")
 
 
-def demonstrate_insurance_agent():
+def demonstrate_insurance_agent(insurance_agent=None, write=None):
     """Demonstrate InsuranceReimbursementAgent functionality"""
-    print("\n=== INSURANCE REIMBURSEMENT AGENT DEMO ===\n")
+    out = []
+    out.append("\n=== INSURANCE REIMBURSEMENT AGENT DEMO ===\n")
     
-    # Initialize the insurance agent
-    insurance_agent = InsuranceReimbursementAgent()
-    print("Insurance Reimbursement Agent initialized with default providers")
+    # Initialize the insurance agent unless one was provided
+    if insurance_agent is None:
+        insurance_agent = InsuranceReimbursementAgent()
+    out.append("Insurance Reimbursement Agent initialized with default providers")
     
     # Verify coverage
-    print("\n--- Insurance Coverage Verification ---")
+    out.append("\n--- Insurance Coverage Verification ---")
     insurance_id = "INS98765"
     provider_code = "blue_cross"
     cpt_code = "90837"  # 60-minute therapy
@@ -106,15 +129,15 @@ def demonstrate_insurance_agent():
         cpt_code=cpt_code
     )
     
-    print(f"Coverage verified: {coverage['verified']}")
-    print(f"Provider: {coverage['provider']}")
-    print(f"CPT Code: {coverage['cpt_code']}")
-    print(f"Coverage Percentage: {coverage['coverage_percentage'] * 100:.1f}%")
-    print(f"Requires Preauthorization: {coverage['requires_preauthorization']}")
-    print(f"Patient Responsibility: {coverage['estimated_patient_responsibility'] * 100:.1f}%")
+    out.append(f"Coverage verified: {coverage['verified']}")
+    out.append(f"Provider: {coverage['provider']}")
+    out.append(f"CPT Code: {coverage['cpt_code']}")
+    out.append(f"Coverage Percentage: {_pct(coverage['coverage_percentage'] * 100)}")
+    out.append(f"Requires Preauthorization: {coverage['requires_preauthorization']}")
+    out.append(f"Patient Responsibility: {_pct(coverage['estimated_patient_responsibility'] * 100)}")
     
     # Submit claim
-    print("\n--- Claim Submission ---")
+    out.append("\n--- Claim Submission ---")
     patient_info = {
         "patient_id": "PT12345",
         "name": "Jane Doe",
@@ -147,63 +170,68 @@ def demonstrate_insurance_agent():
         insurance_info=insurance_info
     )
     
-    print(f"Claim submission successful: {claim['success']}")
-    print(f"Claim ID: {claim['claim_id']}")
-    print(f"Submission Date: {claim['submission_date']}")
-    print(f"Status: {claim['status']}")
-    print(f"Estimated Reimbursement: ${claim['estimated_reimbursement']:.2f}")
+    out.append(f"Claim submission successful: {claim['success']}")
+    out.append(f"Claim ID: {claim['claim_id']}")
+    out.append(f"Submission Date: {claim['submission_date']}")
+    out.append(f"Status: {claim['status']}")
+    out.append(f"Estimated Reimbursement: {_money(claim['estimated_reimbursement'])}")
     
     # Check claim status
-    print("\n--- Claim Status Check ---")
+    out.append("\n--- Claim Status Check ---")
     claim_id = claim['claim_id']
     status = insurance_agent.check_claim_status(claim_id)
     
-    print(f"Claim ID: {status['claim_id']}")
-    print(f"Status: {status['status']}")
-    print(f"Submission Date: {status['submission_date']}")
+    out.append(f"Claim ID: {status['claim_id']}")
+    out.append(f"Status: {status['status']}")
+    out.append(f"Submission Date: {status['submission_date']}")
     
     # Update claim status
-    print("\n--- Claim Status Update ---")
+    out.append("\n--- Claim Status Update ---")
     update = insurance_agent.update_claim_status(
         claim_id=claim_id,
         new_status="approved",
         notes="Claim approved by insurance provider"
     )
     
-    print(f"Status update successful: {update['success']}")
-    print(f"Claim ID: {update['claim_id']}")
-    print(f"New Status: {update['status']}")
-    print(f"Updated At: {update['updated_at']}")
+    out.append(f"Status update successful: {update['success']}")
+    out.append(f"Claim ID: {update['claim_id']}")
+    out.append(f"New Status: {update['status']}")
+    out.append(f"Updated At: {update['updated_at']}")
     
     # Process reimbursement
-    print("\n--- Reimbursement Processing ---")
+    out.append("\n--- Reimbursement Processing ---")
     reimbursement = insurance_agent.process_reimbursement(
         claim_id=claim_id,
         amount=91.00  # 70% of $130.00
     )
     
-    print(f"Reimbursement successful: {reimbursement['success']}")
-    print(f"Reimbursement ID: {reimbursement['reimbursement_id']}")
-    print(f"Claim ID: {reimbursement['claim_id']}")
-    print(f"Amount: ${reimbursement['amount']:.2f}")
-    print(f"Payment Date: {reimbursement['payment_date']}")
+    out.append(f"Reimbursement successful: {reimbursement['success']}")
+    out.append(f"Reimbursement ID: {reimbursement['reimbursement_id']}")
+    out.append(f"Claim ID: {reimbursement['claim_id']}")
+    out.append(f"Amount: {_money(reimbursement['amount'])}")
+    out.append(f"Payment Date: {reimbursement['payment_date']}")
     
     # Get patient claims
-    print("\n--- Patient Claims ---")
+    out.append("\n--- Patient Claims ---")
     patient_id = "PT12345"
     patient_claims = insurance_agent.get_patient_claims(patient_id)
     
-    print(f"Patient ID: {patient_claims['patient_id']}")
-    print(f"Claims Count: {patient_claims['claims_count']}")
+    out.append(f"Patient ID: {patient_claims['patient_id']}")
+    out.append(f"Claims Count: {patient_claims['claims_count']}")
+    
+    (write or sys.stdout.write)("\n".join(out) + "\n")
 
 
-def demonstrate_integrated_workflow():
+def demonstrate_integrated_workflow(billing_agent=None, insurance_agent=None):
     """Demonstrate an integrated workflow between billing and insurance agents"""
-    print("\n=== INTEGRATED WORKFLOW DEMO ===\n")
+    out = []
+    out.append("\n=== INTEGRATED WORKFLOW DEMO ===\n")
     
-    # Initialize agents
-    billing_agent = BillingAgent()
-    insurance_agent = InsuranceReimbursementAgent()
+    # Initialize agents unless they were provided
+    if billing_agent is None:
+        billing_agent = BillingAgent()
+    if insurance_agent is None:
+        insurance_agent = InsuranceReimbursementAgent()
     
     # Patient and service information
     patient_id = "PT54321"
@@ -213,13 +241,13 @@ def demonstrate_integrated_workflow():
     cpt_code = "90834"  # 45-minute therapy
     
     # Step 1: Calculate service cost
-    print("Step 1: Calculate service cost")
+    out.append("Step 1: Calculate service cost")
     service_cost = billing_agent.calculate_service_cost(cpt_code)
-    print(f"Service: {service_cost['service']}")
-    print(f"Total Cost: ${service_cost['total_cost']:.2f}")
+    out.append(f"Service: {service_cost['service']}")
+    out.append(f"Total Cost: {_money(service_cost['total_cost'])}")
     
     # Step 2: Verify insurance coverage
-    print("\nStep 2: Verify insurance coverage")
+    out.append("\nStep 2: Verify insurance coverage")
     coverage = insurance_agent.verify_coverage(
         insurance_id=insurance_id,
         provider_code=provider_code,
@@ -229,21 +257,22 @@ def demonstrate_integrated_workflow():
     coverage_percentage = coverage['coverage_percentage']
     patient_responsibility = coverage['estimated_patient_responsibility']
     
-    print(f"Coverage: {coverage_percentage * 100:.1f}%")
-    print(f"Patient Responsibility: {patient_responsibility * 100:.1f}%")
+    out.append(f"Coverage: {_pct(coverage_percentage * 100)}")
+    out.append(f"Patient Responsibility: {_pct(patient_responsibility * 100)}")
     
     # Step 3: Calculate patient portion and insurance portion
-    print("\nStep 3: Calculate payment portions")
+    out.append("\nStep 3: Calculate payment portions")
     total_cost = service_cost['total_cost']
-    insurance_portion = total_cost * coverage_percentage
-    patient_portion = total_cost * patient_responsibility
+    (insurance_portion,), (patient_portion,) = split_payment_portions(
+        (total_cost,), (coverage_percentage,), (patient_responsibility,)
+    )
     
-    print(f"Total Cost: ${total_cost:.2f}")
-    print(f"Insurance Portion: ${insurance_portion:.2f}")
-    print(f"Patient Portion: ${patient_portion:.2f}")
+    out.append(f"Total Cost: {_money(total_cost)}")
+    out.append(f"Insurance Portion: {_money(insurance_portion)}")
+    out.append(f"Patient Portion: {_money(patient_portion)}")
     
     # Step 4: Process patient payment
-    print("\nStep 4: Process patient payment")
+    out.append("\nStep 4: Process patient payment")
     payment = billing_agent.process_payment(
         patient_id=patient_id,
         amount=patient_portion,
@@ -251,11 +280,11 @@ def demonstrate_integrated_workflow():
         service_details=service_cost
     )
     
-    print(f"Patient Payment: ${payment['amount']:.2f}")
-    print(f"Transaction ID: {payment['transaction_id']}")
+    out.append(f"Patient Payment: {_money(payment['amount'])}")
+    out.append(f"Transaction ID: {payment['transaction_id']}")
     
     # Step 5: Submit insurance claim
-    print("\nStep 5: Submit insurance claim")
+    out.append("\nStep 5: Submit insurance claim")
     patient_info = {
         "patient_id": patient_id,
         "name": patient_name,
@@ -288,11 +317,11 @@ def demonstrate_integrated_workflow():
         insurance_info=insurance_info
     )
     
-    print(f"Claim ID: {claim['claim_id']}")
-    print(f"Estimated Reimbursement: ${claim['estimated_reimbursement']:.2f}")
+    out.append(f"Claim ID: {claim['claim_id']}")
+    out.append(f"Estimated Reimbursement: {_money(claim['estimated_reimbursement'])}")
     
     # Step 6: Update claim status (simulating insurance processing)
-    print("\nStep 6: Update claim status (insurance processing)")
+    out.append("\nStep 6: Update claim status (insurance processing)")
     insurance_agent.update_claim_status(
         claim_id=claim['claim_id'],
         new_status="approved",
@@ -300,36 +329,54 @@ def demonstrate_integrated_workflow():
     )
     
     # Step 7: Process reimbursement
-    print("\nStep 7: Process reimbursement")
+    out.append("\nStep 7: Process reimbursement")
     reimbursement = insurance_agent.process_reimbursement(
         claim_id=claim['claim_id'],
         amount=insurance_portion
     )
     
-    print(f"Reimbursement ID: {reimbursement['reimbursement_id']}")
-    print(f"Reimbursement Amount: ${reimbursement['amount']:.2f}")
+    out.append(f"Reimbursement ID: {reimbursement['reimbursement_id']}")
+    out.append(f"Reimbursement Amount: {_money(reimbursement['amount'])}")
     
     # Step 8: Generate invoice for record-keeping
-    print("\nStep 8: Generate invoice for record-keeping")
+    out.append("\nStep 8: Generate invoice for record-keeping")
     invoice = billing_agent.generate_invoice(
         patient_id=patient_id,
-        services=[service_cost],
+        services=(service_cost,),
         payment_status="paid"
     )
     
-    print(f"Invoice ID: {invoice['invoice_id']}")
-    print(f"Total Amount: ${invoice['total_amount']:.2f}")
-    print(f"Payment Status: {invoice['payment_status']}")
+    out.append(f"Invoice ID: {invoice['invoice_id']}")
+    out.append(f"Total Amount: {_money(invoice['total_amount'])}")
+    out.append(f"Payment Status: {invoice['payment_status']}")
     
-    print("\n=== WORKFLOW COMPLETE ===")
+    out.append("\n=== WORKFLOW COMPLETE ===")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
     print("EneHealths Billing and Insurance Reimbursement Agents Demo")
     print("=" * 60)
     
-    demonstrate_billing_agent()
-    demonstrate_insurance_agent()
-    demonstrate_integrated_workflow()
+    # Share one pair of agents across the demos
+    billing_agent = BillingAgent()
+    insurance_agent = InsuranceReimbursementAgent()
+    
+    # The billing and insurance demos use separate agents, so run them
+    # concurrently and write their sections in order once both finish
+    sections = ([], [])
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(demonstrate_billing_agent, billing_agent, sections[0].append),
+            executor.submit(demonstrate_insurance_agent, insurance_agent, sections[1].append),
+        ]
+        for future in futures:
+            future.result()
+    
+    for section in sections:
+        sys.stdout.write("".join(section))
+    
+    demonstrate_integrated_workflow(billing_agent, insurance_agent)
     
     print("\nDemo completed successfully!")
\ No newline at end of file
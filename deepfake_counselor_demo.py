@@ -13,24 +13,37 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.agents.deepfake_counselor import DeepfakeCounselorAgent
 
+# Section separators
+_SEP = "=" * 80
+_SUBSEP = "-" * 40
+
+# Inputs that end the interactive demo
+_EXIT_TOKENS = frozenset({"exit", "quit", "bye"})
+
+# Run preset scenarios back-to-back without prompts, e.g. for timed or CI runs
+NONINTERACTIVE = (
+    os.environ.get("ENE_DEMO_NONINTERACTIVE") == "1"
+    or "--batch" in sys.argv[1:]
+)
+
 
 def run_interactive_demo():
     """Run an interactive demo of the DeepfakeCounselorAgent."""
     counselor = DeepfakeCounselorAgent()
     
-    print("=" * 80)
+    print(_SEP)
     print("EneHealths Deepfake Counselor and Mental Health Advice Demo")
-    print("=" * 80)
+    print(_SEP)
     print("\nThis agent can provide support for:")
     print("1. Deepfake-related concerns (victimization, anxiety about deepfakes)")
     print("2. Common mental health issues (anxiety, depression, stress, etc.)")
     print("\nType 'exit' to quit the demo.")
-    print("=" * 80)
+    print(_SEP)
     
     while True:
         user_input = input("\nPlease enter your concern or question: ")
         
-        if user_input.lower() in ['exit', 'quit', 'bye']:
+        if user_input.strip().casefold() in _EXIT_TOKENS:
             print("\nThank you for using the EneHealths Deepfake Counselor. Take care!")
             break
         
@@ -74,13 +87,13 @@ def run_preset_scenarios():
         }
     ]
     
-    print("=" * 80)
+    print(_SEP)
     print("EneHealths Deepfake Counselor and Mental Health Advice Demo")
-    print("=" * 80)
+    print(_SEP)
     
     for i, scenario in enumerate(scenarios, 1):
         print(f"\nScenario {i}: {scenario['title']}")
-        print("-" * 40)
+        print(_SUBSEP)
         print(f"User Input: {scenario['input']}")
         
         # Process the input and get response
@@ -88,14 +101,18 @@ def run_preset_scenarios():
         
         print("\nCounselor Response:")
         print(response)
-        print("=" * 80)
+        print(_SEP)
         
         # Pause between scenarios for readability
-        if i < len(scenarios):
+        if i < len(scenarios) and not NONINTERACTIVE:
             input("\nPress Enter to continue to the next scenario...")
 
 
 if __name__ == "__main__":
+    if NONINTERACTIVE:
+        run_preset_scenarios()
+        sys.exit(0)
+    
     print("Choose demo mode:")
     print("1. Run preset scenarios")
     print("2. Interactive mode")
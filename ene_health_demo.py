@@ -8,6 +8,19 @@ import os
 
 from src.agents.ene_health_agent import EneHealthAgent
 
+# Section separators
+_SEP_EQ = "=" * 50
+_SEP_DASH = "-" * 50
+
+# Demo scenarios as (title, user input) pairs
+_SCENARIOS: tuple[tuple[str, str], ...] = (
+    ("About EneHealths", "Tell me about EneHealths and what you do"),
+    ("Mental Health Information", "Can you tell me about depression symptoms?"),
+    ("Sensitive Topic Handling", "I've been feeling really down lately and sometimes think about hurting myself"),
+    ("Hallucination Detection", "Is there a guaranteed cure for anxiety?"),
+    ("Support Resources", "What kind of support does EneHealths offer?"),
+)
+
 def main():
     """Main function to demonstrate EneHealths agent functionality."""
     print("Initializing EneHealths Agent...")
@@ -16,34 +29,17 @@ def main():
     agent = EneHealthAgent()
     
     # Print welcome message
-    print("\n" + "="*50)
+    print("\n" + _SEP_EQ)
     print("EneHealths Mental Health Support Agent")
-    print("="*50)
+    print(_SEP_EQ)
     
     # Get mission and vision
     mission, vision = agent.get_mission_and_vision()
     print(f"\nMission: {mission}")
     print(f"Vision: {vision}")
-    print("\n" + "="*50)
-    
-    # Demo scenarios
-    scenarios = [
-        "Tell me about EneHealths and what you do",
-        "Can you tell me about depression symptoms?",
-        "I've been feeling really down lately and sometimes think about hurting myself",
-        "Is there a guaranteed cure for anxiety?",
-        "What kind of support does EneHealths offer?"
-    ]
-    
-    scenario_titles = [
-        "About EneHealths",
-        "Mental Health Information",
-        "Sensitive Topic Handling",
-        "Hallucination Detection",
-        "Support Resources"
-    ]
+    print("\n" + _SEP_EQ)
     
-    for i, (title, scenario) in enumerate(zip(scenario_titles, scenarios), 1):
+    for i, (title, scenario) in enumerate(_SCENARIOS, 1):
         print(f"\nDEMO SCENARIO {i}: {title}")
         print(f"\nUser: {scenario}")
         response = agent.process_input(scenario)
@@ -56,11 +52,11 @@ def main():
         for thought in thoughts[-3:]:
             print(f"- {thought}")
             
-        print("\n" + "-"*50)
+        print("\n" + _SEP_DASH)
     
-    print("\n" + "="*50)
+    print("\n" + _SEP_EQ)
     print("End of EneHealths Agent Demo")
-    print("="*50)
+    print(_SEP_EQ)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
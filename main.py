@@ -10,19 +10,19 @@ and narrate its thought process when requested by the user.
 
 import sys
 import os
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
-# Import local modules
-from src.voice_agent import VoiceAgent
-from src.ui.main_window import MainWindow
-from PyQt5.QtWidgets import QApplication
 
 
 def main():
     """Main entry point for the application."""
+    # Load environment variables and heavy UI modules only when the app runs,
+    # so importing this module stays cheap
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    from PyQt5.QtWidgets import QApplication
+    from src.voice_agent import VoiceAgent
+    from src.ui.main_window import MainWindow
+    
     # Initialize the application
     app = QApplication(sys.argv)
     
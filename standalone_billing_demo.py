@@ -8,8 +8,293 @@ InsuranceReimbursementAgent without any external dependencies.
 
 import json
 import datetime
-import uuid
-from typing import Dict, List, Optional, Tuple, Any
+import itertools
+import secrets
+import sys
+from collections import deque
+from dataclasses import asdict, dataclass, field, fields, is_dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Deque, Dict, FrozenSet, Iterator, List, Mapping, Optional, Sequence, Tuple, Union, Any
+
+
+# Payment methods accepted by BillingAgent.process_payment
+_PAYMENT_METHODS: FrozenSet[str] = frozenset({"credit_card", "debit_card", "insurance", "bank_transfer"})
+
+
+def _freeze_table(table: Dict[str, Any]) -> Mapping[str, Any]:
+    """Wrap a table and every mapping nested in it in read-only mapping proxies."""
+    return MappingProxyType({
+        key: _freeze_table(value) if isinstance(value, dict) else value
+        for key, value in table.items()
+    })
+
+
+# Default CPT codes for mental health services, shared by every BillingAgent
+_CPT_CODES: Mapping[str, Mapping[str, Any]] = _freeze_table({
+    "90791": {
+        "description": "Psychiatric diagnostic evaluation",
+        "rate": 150.00,
+        "duration_minutes": 50
+    },
+    "90832": {
+        "description": "Psychotherapy, 30 minutes",
+        "rate": 65.00,
+        "duration_minutes": 30
+    },
+    "90834": {
+        "description": "Psychotherapy, 45 minutes",
+        "rate": 85.00,
+        "duration_minutes": 45
+    },
+    "90837": {
+        "description": "Psychotherapy, 60 minutes",
+        "rate": 130.00,
+        "duration_minutes": 60
+    },
+    "90853": {
+        "description": "Group psychotherapy",
+        "rate": 50.00,
+        "duration_minutes": 90
+    },
+    "96127": {
+        "description": "Brief emotional/behavioral assessment",
+        "rate": 25.00,
+        "duration_minutes": 15
+    }
+})
+
+# Default insurance provider information, shared by every InsuranceReimbursementAgent
+_INSURANCE_PROVIDERS: Mapping[str, Mapping[str, Any]] = _freeze_table({
+    "blue_cross": {
+        "name": "Blue Cross Blue Shield",
+        "contact": "1-800-123-4567",
+        "website": "https://www.bluecross.com",
+        "coverage": {
+            "90791": 0.80,  # Coverage percentage for diagnostic evaluation
+            "90832": 0.70,  # Coverage for 30-min therapy
+            "90834": 0.70,  # Coverage for 45-min therapy
+            "90837": 0.70,  # Coverage for 60-min therapy
+            "90853": 0.80,  # Coverage for group therapy
+            "96127": 0.90   # Coverage for assessment
+        },
+        "requires_preauth": frozenset({"90791"})
+    },
+    "aetna": {
+        "name": "Aetna",
+        "contact": "1-800-987-6543",
+        "website": "https://www.aetna.com",
+        "coverage": {
+            "90791": 0.75,
+            "90832": 0.75,
+            "90834": 0.75,
+            "90837": 0.75,
+            "90853": 0.85,
+            "96127": 0.85
+        },
+        "requires_preauth": frozenset({"90791", "90837"})
+    },
+    "united": {
+        "name": "UnitedHealthcare",
+        "contact": "1-800-456-7890",
+        "website": "https://www.unitedhealthcare.com",
+        "coverage": {
+            "90791": 0.70,
+            "90832": 0.70,
+            "90834": 0.70,
+            "90837": 0.70,
+            "90853": 0.80,
+            "96127": 0.80
+        },
+        "requires_preauth": frozenset()
+    }
+})
+
+# Flattened coverage lookup:
+# (provider_code, cpt_code) -> (provider name, coverage, patient responsibility, requires preauth)
+_COVERAGE_TABLE: Mapping[Tuple[str, str], Tuple[str, float, float, bool]] = MappingProxyType({
+    (provider_code, cpt_code): (provider["name"], pct, 1.0 - pct, cpt_code in provider["requires_preauth"])
+    for provider_code, provider in _INSURANCE_PROVIDERS.items()
+    for cpt_code, pct in provider["coverage"].items()
+})
+
+
+@dataclass(slots=True, frozen=True)
+class PatientInfo:
+    """Patient details submitted with an insurance claim."""
+    patient_id: str
+    name: str
+    dob: str
+
+
+@dataclass(slots=True, frozen=True)
+class ProviderInfo:
+    """Rendering provider details submitted with an insurance claim."""
+    provider_id: str
+    name: str
+    npi: str
+
+
+@dataclass(slots=True, frozen=True)
+class ServiceInfo:
+    """Details of the service being claimed."""
+    cpt_code: str
+    service_date: str
+    diagnosis_code: str
+    total_cost: float
+
+
+@dataclass(slots=True, frozen=True)
+class InsuranceInfo:
+    """Patient insurance details submitted with an insurance claim."""
+    insurance_id: str
+    provider_code: str
+    group_number: str
+
+
+ClaimInfo = Union[PatientInfo, ProviderInfo, ServiceInfo, InsuranceInfo, Dict[str, Any]]
+
+
+def _freeze_info(info: ClaimInfo) -> Mapping[str, Any]:
+    """Return a read-only snapshot of claim info given as a dataclass or a dict."""
+    return MappingProxyType(asdict(info) if is_dataclass(info) else dict(info))
+
+
+@dataclass(slots=True)
+class Transaction:
+    """A completed patient payment."""
+    transaction_id: str
+    patient_id: str
+    amount: float
+    payment_method: str
+    service_details: Dict[str, Any]
+    timestamp: str
+    status: str
+
+
+@dataclass(slots=True)
+class Invoice:
+    """An invoice issued to a patient."""
+    invoice_id: str
+    patient_id: str
+    services: Sequence[Dict[str, Any]]
+    total_amount: float
+    issue_date: str
+    due_date: str
+    payment_status: str
+
+
+@dataclass(slots=True)
+class Claim:
+    """An insurance claim and its status history."""
+    claim_id: str
+    patient_info: Mapping[str, Any]
+    provider_info: Mapping[str, Any]
+    service_info: Mapping[str, Any]
+    insurance_info: Mapping[str, Any]
+    coverage_details: Dict[str, Any]
+    submission_date: str
+    status: str
+    status_history: Deque[Mapping[str, Any]] = field(default_factory=deque)
+
+
+@dataclass(slots=True)
+class Reimbursement:
+    """A reimbursement paid against an approved claim."""
+    reimbursement_id: str
+    claim_id: str
+    amount: float
+    payment_date: str
+    patient_info: Mapping[str, Any]
+    insurance_info: Mapping[str, Any]
+    service_info: Mapping[str, Any]
+
+
+def _record_dict(record: Any) -> Dict[str, Any]:
+    """Return a stored record as a dict for callers, sharing its field values."""
+    return {f.name: getattr(record, f.name) for f in fields(record)}
+
+
+# Upper bound on each record log kept in memory; the oldest records are dropped first
+_MAX_RECORDS = 10_000
+
+# Upper bound on the unmodified service costs each BillingAgent remembers
+_MAX_CACHED_COSTS = 256
+
+
+class PatientStore:
+    """
+    In-memory patient records shared by the billing and insurance agents.
+    """
+    
+    def __init__(self):
+        """Initialize empty record collections."""
+        self.transactions: Deque[Transaction] = deque(maxlen=_MAX_RECORDS)
+        self.invoices: Deque[Invoice] = deque(maxlen=_MAX_RECORDS)
+        self.claims: Deque[Claim] = deque(maxlen=_MAX_RECORDS)
+        self.reimbursements: Deque[Reimbursement] = deque(maxlen=_MAX_RECORDS)
+        
+        # Sequence numbers keep IDs unique once old records have been dropped
+        self.transaction_numbers: Iterator[int] = itertools.count(1)
+        self.invoice_numbers: Iterator[int] = itertools.count(1)
+        
+        # Per-patient and by-ID indexes so lookups don't scan every record;
+        # records dropped from a log are dropped from its indexes too
+        self.transactions_by_patient: Dict[str, Deque[Transaction]] = {}
+        self.invoices_by_patient: Dict[str, Deque[Invoice]] = {}
+        self.claims_by_patient: Dict[str, Deque[Claim]] = {}
+        self.invoices_by_id: Dict[str, Invoice] = {}
+        self.claims_by_id: Dict[str, Claim] = {}
+        
+        # Running per-patient totals, kept current as records are added; these
+        # cover every record ever added, including ones since dropped
+        self.paid_by_patient: Dict[str, float] = {}
+        self.outstanding_by_patient: Dict[str, float] = {}
+    
+    def add_transaction(self, transaction: Transaction) -> None:
+        """Record a transaction and index it by patient."""
+        self._append(self.transactions, self.transactions_by_patient,
+                     transaction.patient_id, transaction, lambda t: t.patient_id)
+    
+    def add_invoice(self, invoice: Invoice) -> None:
+        """Record an invoice and index it by patient and ID."""
+        dropped = self._append(self.invoices, self.invoices_by_patient,
+                               invoice.patient_id, invoice, lambda i: i.patient_id)
+        # A newer record may have reused the dropped record's ID; leave its entry alone
+        if dropped is not None and self.invoices_by_id.get(dropped.invoice_id) is dropped:
+            del self.invoices_by_id[dropped.invoice_id]
+        self.invoices_by_id[invoice.invoice_id] = invoice
+    
+    def add_claim(self, claim: Claim) -> None:
+        """Record a claim and index it by patient and ID."""
+        dropped = self._append(self.claims, self.claims_by_patient,
+                               _claim_patient_id(claim), claim, _claim_patient_id)
+        # Claim IDs are random, so a newer claim may have reused the dropped one's ID
+        if dropped is not None and self.claims_by_id.get(dropped.claim_id) is dropped:
+            del self.claims_by_id[dropped.claim_id]
+        self.claims_by_id[claim.claim_id] = claim
+    
+    @staticmethod
+    def _append(log: Deque[Any], by_patient: Dict[str, Deque[Any]], patient_id: str,
+                record: Any, patient_of: Callable[[Any], str]) -> Optional[Any]:
+        """Append a record to a bounded log and its patient index, returning any record dropped."""
+        dropped = None
+        if len(log) == log.maxlen:
+            # The oldest record in the log is also the oldest for its patient
+            dropped = log.popleft()
+            dropped_patient = patient_of(dropped)
+            records = by_patient[dropped_patient]
+            records.popleft()
+            if not records:
+                del by_patient[dropped_patient]
+        log.append(record)
+        by_patient.setdefault(patient_id, deque()).append(record)
+        return dropped
+
+
+def _claim_patient_id(claim: Claim) -> str:
+    """Get the patient ID a claim is filed under."""
+    return claim.patient_info.get("patient_id", "")
 
 
 class BillingAgent:
@@ -17,49 +302,16 @@ class BillingAgent:
     Agent responsible for handling billing operations for EneHealths mental health services.
     """
     
-    def __init__(self):
+    def __init__(self, store: Optional[PatientStore] = None):
         """Initialize the BillingAgent with billing configurations."""
-        self.cpt_codes = self._load_cpt_codes()
-        self.payment_methods = ["credit_card", "debit_card", "insurance", "bank_transfer"]
-        self.transactions = []
-        self.invoices = []
-        
-    def _load_cpt_codes(self) -> Dict[str, Dict[str, Any]]:
-        """Load default CPT codes for mental health services."""
-        return {
-            "90791": {
-                "description": "Psychiatric diagnostic evaluation",
-                "rate": 150.00,
-                "duration_minutes": 50
-            },
-            "90832": {
-                "description": "Psychotherapy, 30 minutes",
-                "rate": 65.00,
-                "duration_minutes": 30
-            },
-            "90834": {
-                "description": "Psychotherapy, 45 minutes",
-                "rate": 85.00,
-                "duration_minutes": 45
-            },
-            "90837": {
-                "description": "Psychotherapy, 60 minutes",
-                "rate": 130.00,
-                "duration_minutes": 60
-            },
-            "90853": {
-                "description": "Group psychotherapy",
-                "rate": 50.00,
-                "duration_minutes": 90
-            },
-            "96127": {
-                "description": "Brief emotional/behavioral assessment",
-                "rate": 25.00,
-                "duration_minutes": 15
-            }
-        }
-    
-    def verify_cpt_code(self, code: str) -> Tuple[bool, Dict[str, Any]]:
+        self.cpt_codes = _CPT_CODES
+        self.payment_methods = _PAYMENT_METHODS
+        self.store = store if store is not None else PatientStore()
+        self.transactions = self.store.transactions
+        self.invoices = self.store.invoices
+        self._service_costs: Dict[Tuple[str, int], Mapping[str, Any]] = {}
+        
+    def verify_cpt_code(self, code: str) -> Tuple[bool, Mapping[str, Any]]:
         """Verify if a CPT code is valid and return its details."""
         if code in self.cpt_codes:
             return True, self.cpt_codes[code]
@@ -68,6 +320,13 @@ class BillingAgent:
     def calculate_service_cost(self, cpt_code: str, units: int = 1, 
                               modifiers: Optional[List[str]] = None) -> Dict[str, Any]:
         """Calculate the cost of a service based on CPT code and modifiers."""
+        # Unmodified services are fully determined by (code, units), so reuse
+        # the cost computed on the first request; callers get their own copy
+        if not modifiers:
+            cached = self._service_costs.get((cpt_code, units))
+            if cached is not None:
+                return {**cached, "modifiers": []}
+        
         is_valid, code_details = self.verify_cpt_code(cpt_code)
         
         if not is_valid:
@@ -78,16 +337,10 @@ class BillingAgent:
             }
         
         base_rate = code_details["rate"]
-        total_cost = base_rate * units
-        
-        # Apply modifiers if any
-        if modifiers:
-            if "22" in modifiers:  # Increased procedural service
-                total_cost *= 1.5
-            if "52" in modifiers:  # Reduced service
-                total_cost *= 0.5
+        multiplier = BillingAgent._modifier_multiplier(frozenset(modifiers) if modifiers else frozenset())
+        total_cost = base_rate * units * multiplier
         
-        return {
+        service_cost = {
             "success": True,
             "service": code_details["description"],
             "base_rate": base_rate,
@@ -96,11 +349,30 @@ class BillingAgent:
             "total_cost": total_cost,
             "duration_minutes": code_details["duration_minutes"] * units
         }
+        
+        if not modifiers:
+            if len(self._service_costs) >= _MAX_CACHED_COSTS:
+                # Drop the oldest entry; units can be any caller-supplied value
+                del self._service_costs[next(iter(self._service_costs))]
+            self._service_costs[(cpt_code, units)] = MappingProxyType({**service_cost, "modifiers": ()})
+        
+        return service_cost
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _modifier_multiplier(modifiers: FrozenSet[str]) -> float:
+        """Get the cost multiplier for a set of CPT modifiers."""
+        multiplier = 1.0
+        if "22" in modifiers:  # Increased procedural service
+            multiplier *= 1.5
+        if "52" in modifiers:  # Reduced service
+            multiplier *= 0.5
+        return multiplier
     
     def process_payment(self, patient_id: str, amount: float, 
                        payment_method: str, service_details: Dict[str, Any]) -> Dict[str, Any]:
         """Process a payment for services rendered."""
-        if payment_method not in self.payment_methods:
+        if payment_method not in _PAYMENT_METHODS:
             return {
                 "success": False,
                 "error": f"Invalid payment method: {payment_method}",
@@ -108,62 +380,103 @@ class BillingAgent:
             }
         
         # Generate transaction ID
-        transaction_id = f"TXN-{len(self.transactions) + 1}-{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}"
-        
-        transaction = {
-            "transaction_id": transaction_id,
-            "patient_id": patient_id,
-            "amount": amount,
-            "payment_method": payment_method,
-            "service_details": service_details,
-            "timestamp": datetime.datetime.now().isoformat(),
-            "status": "completed"
-        }
+        now = datetime.datetime.now()
+        transaction_id = f"TXN-{next(self.store.transaction_numbers)}-{now.strftime('%Y%m%d%H%M%S')}"
+        
+        transaction = Transaction(
+            transaction_id=transaction_id,
+            patient_id=patient_id,
+            amount=amount,
+            payment_method=payment_method,
+            service_details=service_details,
+            timestamp=now.isoformat(),
+            status="completed"
+        )
         
-        self.transactions.append(transaction)
+        self.store.add_transaction(transaction)
+        paid = self.store.paid_by_patient
+        paid[patient_id] = paid.get(patient_id, 0.0) + amount
         
         return {
             "success": True,
             "transaction_id": transaction_id,
             "amount": amount,
-            "timestamp": transaction["timestamp"]
+            "timestamp": transaction.timestamp
         }
     
-    def generate_invoice(self, patient_id: str, services: List[Dict[str, Any]], 
+    def generate_invoice(self, patient_id: str, services: Sequence[Dict[str, Any]], 
                         payment_status: str = "unpaid") -> Dict[str, Any]:
         """Generate an invoice for services provided to a patient."""
         # Calculate total amount
         total_amount = sum(service.get("total_cost", 0) for service in services)
         
         # Generate invoice ID
-        invoice_id = f"INV-{len(self.invoices) + 1}-{datetime.datetime.now().strftime('%Y%m%d')}"
+        now = datetime.datetime.now()
+        invoice_id = f"INV-{next(self.store.invoice_numbers)}-{now.strftime('%Y%m%d')}"
+        
+        invoice = Invoice(
+            invoice_id=invoice_id,
+            patient_id=patient_id,
+            services=services,
+            total_amount=total_amount,
+            issue_date=now.isoformat(),
+            due_date=(now + datetime.timedelta(days=30)).isoformat(),
+            payment_status=payment_status
+        )
         
-        invoice = {
-            "invoice_id": invoice_id,
-            "patient_id": patient_id,
-            "services": services,
-            "total_amount": total_amount,
-            "issue_date": datetime.datetime.now().isoformat(),
-            "due_date": (datetime.datetime.now() + datetime.timedelta(days=30)).isoformat(),
-            "payment_status": payment_status
-        }
+        self.store.add_invoice(invoice)
+        if payment_status == "unpaid":
+            self._adjust_outstanding(patient_id, total_amount)
         
-        self.invoices.append(invoice)
+        return _record_dict(invoice)
+    
+    def update_invoice_status(self, invoice_id: str, new_status: str) -> Dict[str, Any]:
+        """Update the payment status of an invoice."""
+        invoice = self.store.invoices_by_id.get(invoice_id)
         
-        return invoice
+        if invoice is None:
+            return {
+                "success": False,
+                "error": f"Invoice not found: {invoice_id}"
+            }
+        
+        old_status = invoice.payment_status
+        invoice.payment_status = new_status
+        
+        # Keep the patient's outstanding balance in step with the change
+        if old_status == "unpaid" and new_status != "unpaid":
+            self._adjust_outstanding(invoice.patient_id, -invoice.total_amount)
+        elif old_status != "unpaid" and new_status == "unpaid":
+            self._adjust_outstanding(invoice.patient_id, invoice.total_amount)
+        
+        return {
+            "success": True,
+            "invoice_id": invoice_id,
+            "payment_status": new_status
+        }
+    
+    def _adjust_outstanding(self, patient_id: str, delta: float) -> None:
+        """Add delta to a patient's running outstanding balance."""
+        outstanding = self.store.outstanding_by_patient
+        outstanding[patient_id] = outstanding.get(patient_id, 0.0) + delta
+    
+    def generate_invoice_for_codes(self, patient_id: str, services_key: Tuple[Tuple[str, int], ...],
+                                   payment_status: str = "unpaid") -> Dict[str, Any]:
+        """Generate an invoice from (cpt_code, units) pairs using cached service costs."""
+        services = tuple(self.calculate_service_cost(code, units) for code, units in services_key)
+        return self.generate_invoice(patient_id, services, payment_status)
     
     def get_patient_billing_history(self, patient_id: str) -> Dict[str, Any]:
         """Retrieve billing history for a specific patient."""
-        transactions = [t for t in self.transactions if t["patient_id"] == patient_id]
-        invoices = [i for i in self.invoices if i["patient_id"] == patient_id]
+        transactions = [_record_dict(t) for t in self.store.transactions_by_patient.get(patient_id, ())]
+        invoices = [_record_dict(i) for i in self.store.invoices_by_patient.get(patient_id, ())]
         
         return {
             "patient_id": patient_id,
             "transactions": transactions,
             "invoices": invoices,
-            "total_paid": sum(t["amount"] for t in transactions),
-            "outstanding_balance": sum(i["total_amount"] for i in invoices 
-                                     if i["payment_status"] == "unpaid")
+            "total_paid": self.store.paid_by_patient.get(patient_id, 0.0),
+            "outstanding_balance": self.store.outstanding_by_patient.get(patient_id, 0.0)
         }
 
 
@@ -172,215 +485,187 @@ class InsuranceReimbursementAgent:
     Agent responsible for handling insurance reimbursement operations for EneHealths.
     """
     
-    def __init__(self):
+    def __init__(self, store: Optional[PatientStore] = None):
         """Initialize the InsuranceReimbursementAgent with insurance configurations."""
-        self.insurance_providers = self._load_insurance_providers()
-        self.claims = []
-        self.reimbursements = []
+        self.insurance_providers = _INSURANCE_PROVIDERS
+        self.store = store if store is not None else PatientStore()
+        self.claims = self.store.claims
+        self.reimbursements = self.store.reimbursements
+        self._claims_by_id = self.store.claims_by_id
         
-    def _load_insurance_providers(self) -> Dict[str, Dict[str, Any]]:
-        """Load default insurance provider information."""
-        return {
-            "blue_cross": {
-                "name": "Blue Cross Blue Shield",
-                "contact": "1-800-123-4567",
-                "website": "https://www.bluecross.com",
-                "coverage": {
-                    "90791": 0.80,  # Coverage percentage for diagnostic evaluation
-                    "90832": 0.70,  # Coverage for 30-min therapy
-                    "90834": 0.70,  # Coverage for 45-min therapy
-                    "90837": 0.70,  # Coverage for 60-min therapy
-                    "90853": 0.80,  # Coverage for group therapy
-                    "96127": 0.90   # Coverage for assessment
-                },
-                "requires_preauth": ["90791"]
-            },
-            "aetna": {
-                "name": "Aetna",
-                "contact": "1-800-987-6543",
-                "website": "https://www.aetna.com",
-                "coverage": {
-                    "90791": 0.75,
-                    "90832": 0.75,
-                    "90834": 0.75,
-                    "90837": 0.75,
-                    "90853": 0.85,
-                    "96127": 0.85
-                },
-                "requires_preauth": ["90791", "90837"]
-            },
-            "united": {
-                "name": "UnitedHealthcare",
-                "contact": "1-800-456-7890",
-                "website": "https://www.unitedhealthcare.com",
-                "coverage": {
-                    "90791": 0.70,
-                    "90832": 0.70,
-                    "90834": 0.70,
-                    "90837": 0.70,
-                    "90853": 0.80,
-                    "96127": 0.80
-                },
-                "requires_preauth": []
-            }
-        }
-    
     def verify_coverage(self, insurance_id: str, provider_code: str, 
                        cpt_code: str) -> Dict[str, Any]:
         """Verify insurance coverage for a specific service."""
-        if provider_code not in self.insurance_providers:
-            return {
-                "verified": False,
-                "error": f"Unknown insurance provider: {provider_code}",
-                "coverage_percentage": 0.0
-            }
-        
-        provider = self.insurance_providers[provider_code]
+        entry = self._lookup_coverage(provider_code, cpt_code)
         
-        if cpt_code not in provider["coverage"]:
+        if entry is None:
             return {
                 "verified": False,
-                "error": f"Service not covered: {cpt_code}",
+                "error": self._coverage_error(provider_code, cpt_code),
                 "coverage_percentage": 0.0
             }
         
-        coverage_percentage = provider["coverage"][cpt_code]
-        requires_preauth = cpt_code in provider["requires_preauth"]
+        return self._coverage_details(insurance_id, cpt_code, entry)
+    
+    def _lookup_coverage(self, provider_code: str,
+                         cpt_code: str) -> Optional[Tuple[str, float, float, bool]]:
+        """Get the coverage table entry for a provider and CPT code, if covered."""
+        return _COVERAGE_TABLE.get((provider_code, cpt_code))
+    
+    def _coverage_error(self, provider_code: str, cpt_code: str) -> str:
+        """Explain why a provider and CPT code have no coverage entry."""
+        if provider_code not in self.insurance_providers:
+            return f"Unknown insurance provider: {provider_code}"
+        return f"Service not covered: {cpt_code}"
+    
+    def _coverage_details(self, insurance_id: str, cpt_code: str,
+                          entry: Tuple[str, float, float, bool]) -> Dict[str, Any]:
+        """Build the verified coverage details for a coverage table entry."""
+        provider_name, coverage_percentage, patient_responsibility, requires_preauth = entry
         
         return {
             "verified": True,
             "insurance_id": insurance_id,
-            "provider": provider["name"],
+            "provider": provider_name,
             "cpt_code": cpt_code,
             "coverage_percentage": coverage_percentage,
             "requires_preauthorization": requires_preauth,
-            "estimated_patient_responsibility": 1.0 - coverage_percentage
+            "estimated_patient_responsibility": patient_responsibility
         }
     
-    def submit_claim(self, patient_info: Dict[str, Any], provider_info: Dict[str, Any],
-                    service_info: Dict[str, Any], insurance_info: Dict[str, Any]) -> Dict[str, Any]:
+    def submit_claim(self, patient_info: ClaimInfo, provider_info: ClaimInfo,
+                    service_info: ClaimInfo, insurance_info: ClaimInfo) -> Dict[str, Any]:
         """Submit an insurance claim for reimbursement."""
+        # Snapshot the inputs so the claim and any reimbursement can share them
+        # without later changes by the caller leaking into the records
+        patient_info = _freeze_info(patient_info)
+        provider_info = _freeze_info(provider_info)
+        service_info = _freeze_info(service_info)
+        insurance_info = _freeze_info(insurance_info)
+        
         # Verify coverage first
-        coverage = self.verify_coverage(
-            insurance_info.get("insurance_id", ""),
-            insurance_info.get("provider_code", ""),
-            service_info.get("cpt_code", "")
-        )
+        provider_code = insurance_info.get("provider_code", "")
+        cpt_code = service_info.get("cpt_code", "")
+        entry = self._lookup_coverage(provider_code, cpt_code)
         
-        if not coverage["verified"]:
+        if entry is None:
             return {
                 "success": False,
-                "error": coverage.get("error", "Coverage verification failed"),
+                "error": self._coverage_error(provider_code, cpt_code),
                 "claim_id": None
             }
         
+        coverage = self._coverage_details(insurance_info.get("insurance_id", ""), cpt_code, entry)
+        
         # Generate claim ID
-        claim_id = f"CLM-{str(uuid.uuid4())[:8]}"
+        claim_id = f"CLM-{secrets.token_hex(4)}"
         
         # Create claim record
-        claim = {
-            "claim_id": claim_id,
-            "patient_info": patient_info,
-            "provider_info": provider_info,
-            "service_info": service_info,
-            "insurance_info": insurance_info,
-            "coverage_details": coverage,
-            "submission_date": datetime.datetime.now().isoformat(),
-            "status": "submitted",
-            "status_history": [
-                {
+        now_iso = datetime.datetime.now().isoformat()
+        claim = Claim(
+            claim_id=claim_id,
+            patient_info=patient_info,
+            provider_info=provider_info,
+            service_info=service_info,
+            insurance_info=insurance_info,
+            coverage_details=coverage,
+            submission_date=now_iso,
+            status="submitted",
+            status_history=deque([
+                MappingProxyType({
                     "status": "submitted",
-                    "timestamp": datetime.datetime.now().isoformat(),
+                    "timestamp": now_iso,
                     "notes": "Initial claim submission"
-                }
-            ]
-        }
+                })
+            ])
+        )
         
-        self.claims.append(claim)
+        self.store.add_claim(claim)
         
         return {
             "success": True,
             "claim_id": claim_id,
-            "submission_date": claim["submission_date"],
-            "status": claim["status"],
+            "submission_date": claim.submission_date,
+            "status": claim.status,
             "estimated_reimbursement": service_info.get("total_cost", 0) * coverage["coverage_percentage"]
         }
     
-    def check_claim_status(self, claim_id: str) -> Dict[str, Any]:
-        """Check the status of a submitted claim."""
-        for claim in self.claims:
-            if claim["claim_id"] == claim_id:
-                return {
-                    "success": True,
-                    "claim_id": claim_id,
-                    "status": claim["status"],
-                    "status_history": claim["status_history"],
-                    "submission_date": claim["submission_date"]
-                }
+    def check_claim_status(self, claim_id: str, since: Optional[int] = None) -> Dict[str, Any]:
+        """Check the status of a submitted claim, optionally only history from index since onward."""
+        claim = self._claims_by_id.get(claim_id)
+        
+        if claim is None:
+            return {
+                "success": False,
+                "error": f"Claim not found: {claim_id}"
+            }
         
         return {
-            "success": False,
-            "error": f"Claim not found: {claim_id}"
+            "success": True,
+            "claim_id": claim_id,
+            "status": claim.status,
+            "status_history": tuple(itertools.islice(
+                claim.status_history, None if since is None else max(since, 0), None
+            )),
+            "submission_date": claim.submission_date
         }
     
     def update_claim_status(self, claim_id: str, new_status: str, notes: str = "") -> Dict[str, Any]:
         """Update the status of a claim."""
-        for claim in self.claims:
-            if claim["claim_id"] == claim_id:
-                claim["status"] = new_status
-                status_update = {
-                    "status": new_status,
-                    "timestamp": datetime.datetime.now().isoformat(),
-                    "notes": notes
-                }
-                claim["status_history"].append(status_update)
-                
-                return {
-                    "success": True,
-                    "claim_id": claim_id,
-                    "status": new_status,
-                    "updated_at": status_update["timestamp"]
-                }
+        claim = self._claims_by_id.get(claim_id)
+        
+        if claim is None:
+            return {
+                "success": False,
+                "error": f"Claim not found: {claim_id}"
+            }
+        
+        claim.status = new_status
+        # History entries are read-only so callers can't rewrite the audit trail
+        status_update = MappingProxyType({
+            "status": new_status,
+            "timestamp": datetime.datetime.now().isoformat(),
+            "notes": notes
+        })
+        claim.status_history.append(status_update)
         
         return {
-            "success": False,
-            "error": f"Claim not found: {claim_id}"
+            "success": True,
+            "claim_id": claim_id,
+            "status": new_status,
+            "updated_at": status_update["timestamp"]
         }
     
     def process_reimbursement(self, claim_id: str, amount: float) -> Dict[str, Any]:
         """Process a reimbursement for an approved claim."""
         # Find the claim
-        claim = None
-        for c in self.claims:
-            if c["claim_id"] == claim_id:
-                claim = c
-                break
+        claim = self._claims_by_id.get(claim_id)
         
-        if not claim:
+        if claim is None:
             return {
                 "success": False,
                 "error": f"Claim not found: {claim_id}"
             }
         
-        if claim["status"] not in ["approved", "partially_approved"]:
+        if claim.status not in ["approved", "partially_approved"]:
             return {
                 "success": False,
-                "error": f"Claim not in approved status: {claim['status']}"
+                "error": f"Claim not in approved status: {claim.status}"
             }
         
         # Generate reimbursement ID
-        reimbursement_id = f"REIMB-{str(uuid.uuid4())[:8]}"
+        reimbursement_id = f"REIMB-{secrets.token_hex(4)}"
         
         # Create reimbursement record
-        reimbursement = {
-            "reimbursement_id": reimbursement_id,
-            "claim_id": claim_id,
-            "amount": amount,
-            "payment_date": datetime.datetime.now().isoformat(),
-            "patient_info": claim["patient_info"],
-            "insurance_info": claim["insurance_info"],
-            "service_info": claim["service_info"]
-        }
+        reimbursement = Reimbursement(
+            reimbursement_id=reimbursement_id,
+            claim_id=claim_id,
+            amount=amount,
+            payment_date=datetime.datetime.now().isoformat(),
+            patient_info=claim.patient_info,
+            insurance_info=claim.insurance_info,
+            service_info=claim.service_info
+        )
         
         self.reimbursements.append(reimbursement)
         
@@ -396,44 +681,62 @@ class InsuranceReimbursementAgent:
             "reimbursement_id": reimbursement_id,
             "claim_id": claim_id,
             "amount": amount,
-            "payment_date": reimbursement["payment_date"]
+            "payment_date": reimbursement.payment_date
+        }
+    
+    def get_patient_claims(self, patient_id: str) -> Dict[str, Any]:
+        """Retrieve all claims submitted for a specific patient."""
+        claims = []
+        for c in self.store.claims_by_patient.get(patient_id, ()):
+            # Copy the mutable parts so callers can't edit the stored claim
+            claim = _record_dict(c)
+            claim["status_history"] = tuple(c.status_history)
+            claim["coverage_details"] = dict(c.coverage_details)
+            claims.append(claim)
+        
+        return {
+            "patient_id": patient_id,
+            "claims": claims,
+            "claims_count": len(claims)
         }
 
 
 def demonstrate_billing_agent():
     """Demonstrate BillingAgent functionality"""
-    print("\n=== BILLING AGENT DEMO ===\n")
+    # Collect the section output and write it in one call at the end
+    out = []
+    out.append("\n=== BILLING AGENT DEMO ===\n")
     
     # Initialize the billing agent
     billing_agent = BillingAgent()
-    print("Billing Agent initialized with default CPT codes")
+    out.append("Billing Agent initialized with default CPT codes")
     
     # Verify CPT codes
-    print("\n--- CPT Code Verification ---")
+    out.append("\n--- CPT Code Verification ---")
     valid_code = "90834"  # 45-minute psychotherapy
     invalid_code = "99999"
     
     is_valid, code_details = billing_agent.verify_cpt_code(valid_code)
-    print(f"CPT Code {valid_code} valid: {is_valid}")
+    out.append(f"CPT Code {valid_code} valid: {is_valid}")
     if is_valid:
-        print(f"Description: {code_details['description']}")
-        print(f"Rate: ${code_details['rate']:.2f}")
-        print(f"Duration: {code_details['duration_minutes']} minutes")
+        out.append(f"Description: {code_details['description']}")
+        out.append(f"Rate: ${code_details['rate']:.2f}")
+        out.append(f"Duration: {code_details['duration_minutes']} minutes")
     
     is_valid, _ = billing_agent.verify_cpt_code(invalid_code)
-    print(f"CPT Code {invalid_code} valid: {is_valid}")
+    out.append(f"CPT Code {invalid_code} valid: {is_valid}")
     
     # Calculate service cost
-    print("\n--- Service Cost Calculation ---")
+    out.append("\n--- Service Cost Calculation ---")
     service_cost = billing_agent.calculate_service_cost("90837", units=1)
-    print(f"Service: {service_cost['service']}")
-    print(f"Base Rate: ${service_cost['base_rate']:.2f}")
-    print(f"Units: {service_cost['units']}")
-    print(f"Total Cost: ${service_cost['total_cost']:.2f}")
-    print(f"Duration: {service_cost['duration_minutes']} minutes")
+    out.append(f"Service: {service_cost['service']}")
+    out.append(f"Base Rate: ${service_cost['base_rate']:.2f}")
+    out.append(f"Units: {service_cost['units']}")
+    out.append(f"Total Cost: ${service_cost['total_cost']:.2f}")
+    out.append(f"Duration: {service_cost['duration_minutes']} minutes")
     
     # Process payment
-    print("\n--- Payment Processing ---")
+    out.append("\n--- Payment Processing ---")
     patient_id = "PT12345"
     payment = billing_agent.process_payment(
         patient_id=patient_id,
@@ -442,41 +745,44 @@ def demonstrate_billing_agent():
         service_details=service_cost
     )
     
-    print(f"Payment successful: {payment['success']}")
-    print(f"Transaction ID: {payment['transaction_id']}")
-    print(f"Amount: ${payment['amount']:.2f}")
+    out.append(f"Payment successful: {payment['success']}")
+    out.append(f"Transaction ID: {payment['transaction_id']}")
+    out.append(f"Amount: ${payment['amount']:.2f}")
     
     # Generate invoice
-    print("\n--- Invoice Generation ---")
-    services = [
-        billing_agent.calculate_service_cost("90791"),  # Diagnostic evaluation
-        billing_agent.calculate_service_cost("90837")   # 60-minute therapy
-    ]
+    out.append("\n--- Invoice Generation ---")
+    services_key = (
+        ("90791", 1),  # Diagnostic evaluation
+        ("90837", 1)   # 60-minute therapy
+    )
     
-    invoice = billing_agent.generate_invoice(
+    invoice = billing_agent.generate_invoice_for_codes(
         patient_id=patient_id,
-        services=services,
+        services_key=services_key,
         payment_status="unpaid"
     )
     
-    print(f"Invoice ID: {invoice['invoice_id']}")
-    print(f"Patient ID: {invoice['patient_id']}")
-    print(f"Total Amount: ${invoice['total_amount']:.2f}")
-    print(f"Issue Date: {invoice['issue_date']}")
-    print(f"Due Date: {invoice['due_date']}")
-    print(f"Payment Status: {invoice['payment_status']}")
+    out.append(f"Invoice ID: {invoice['invoice_id']}")
+    out.append(f"Patient ID: {invoice['patient_id']}")
+    out.append(f"Total Amount: ${invoice['total_amount']:.2f}")
+    out.append(f"Issue Date: {invoice['issue_date']}")
+    out.append(f"Due Date: {invoice['due_date']}")
+    out.append(f"Payment Status: {invoice['payment_status']}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def demonstrate_insurance_agent():
     """Demonstrate InsuranceReimbursementAgent functionality"""
-    print("\n=== INSURANCE REIMBURSEMENT AGENT DEMO ===\n")
+    out = []
+    out.append("\n=== INSURANCE REIMBURSEMENT AGENT DEMO ===\n")
     
     # Initialize the insurance agent
     insurance_agent = InsuranceReimbursementAgent()
-    print("Insurance Reimbursement Agent initialized with default providers")
+    out.append("Insurance Reimbursement Agent initialized with default providers")
     
     # Verify coverage
-    print("\n--- Insurance Coverage Verification ---")
+    out.append("\n--- Insurance Coverage Verification ---")
     insurance_id = "INS98765"
     provider_code = "blue_cross"
     cpt_code = "90837"  # 60-minute therapy
@@ -487,39 +793,39 @@ def demonstrate_insurance_agent():
         cpt_code=cpt_code
     )
     
-    print(f"Coverage verified: {coverage['verified']}")
-    print(f"Provider: {coverage['provider']}")
-    print(f"CPT Code: {coverage['cpt_code']}")
-    print(f"Coverage Percentage: {coverage['coverage_percentage'] * 100:.1f}%")
-    print(f"Requires Preauthorization: {coverage['requires_preauthorization']}")
-    print(f"Patient Responsibility: {coverage['estimated_patient_responsibility'] * 100:.1f}%")
+    out.append(f"Coverage verified: {coverage['verified']}")
+    out.append(f"Provider: {coverage['provider']}")
+    out.append(f"CPT Code: {coverage['cpt_code']}")
+    out.append(f"Coverage Percentage: {coverage['coverage_percentage'] * 100:.1f}%")
+    out.append(f"Requires Preauthorization: {coverage['requires_preauthorization']}")
+    out.append(f"Patient Responsibility: {coverage['estimated_patient_responsibility'] * 100:.1f}%")
     
     # Submit claim
-    print("\n--- Claim Submission ---")
-    patient_info = {
-        "patient_id": "PT12345",
-        "name": "Jane Doe",
-        "dob": "1985-06-15"
-    }
+    out.append("\n--- Claim Submission ---")
+    patient_info = PatientInfo(
+        patient_id="PT12345",
+        name="Jane Doe",
+        dob="1985-06-15"
+    )
     
-    provider_info = {
-        "provider_id": "PROV789",
-        "name": "Dr. Smith",
-        "npi": "1234567890"
-    }
+    provider_info = ProviderInfo(
+        provider_id="PROV789",
+        name="Dr. Smith",
+        npi="1234567890"
+    )
     
-    service_info = {
-        "cpt_code": "90837",
-        "service_date": "2023-09-15",
-        "diagnosis_code": "F41.1",  # Generalized anxiety disorder
-        "total_cost": 130.00
-    }
+    service_info = ServiceInfo(
+        cpt_code="90837",
+        service_date="2023-09-15",
+        diagnosis_code="F41.1",  # Generalized anxiety disorder
+        total_cost=130.00
+    )
     
-    insurance_info = {
-        "insurance_id": insurance_id,
-        "provider_code": provider_code,
-        "group_number": "GRP123456"
-    }
+    insurance_info = InsuranceInfo(
+        insurance_id=insurance_id,
+        provider_code=provider_code,
+        group_number="GRP123456"
+    )
     
     claim = insurance_agent.submit_claim(
         patient_info=patient_info,
@@ -528,46 +834,50 @@ def demonstrate_insurance_agent():
         insurance_info=insurance_info
     )
     
-    print(f"Claim submission successful: {claim['success']}")
-    print(f"Claim ID: {claim['claim_id']}")
-    print(f"Submission Date: {claim['submission_date']}")
-    print(f"Status: {claim['status']}")
-    print(f"Estimated Reimbursement: ${claim['estimated_reimbursement']:.2f}")
+    out.append(f"Claim submission successful: {claim['success']}")
+    out.append(f"Claim ID: {claim['claim_id']}")
+    out.append(f"Submission Date: {claim['submission_date']}")
+    out.append(f"Status: {claim['status']}")
+    out.append(f"Estimated Reimbursement: ${claim['estimated_reimbursement']:.2f}")
     
     # Update claim status
-    print("\n--- Claim Status Update ---")
+    out.append("\n--- Claim Status Update ---")
     update = insurance_agent.update_claim_status(
         claim_id=claim['claim_id'],
         new_status="approved",
         notes="Claim approved by insurance provider"
     )
     
-    print(f"Status update successful: {update['success']}")
-    print(f"Claim ID: {update['claim_id']}")
-    print(f"New Status: {update['status']}")
-    print(f"Updated At: {update['updated_at']}")
+    out.append(f"Status update successful: {update['success']}")
+    out.append(f"Claim ID: {update['claim_id']}")
+    out.append(f"New Status: {update['status']}")
+    out.append(f"Updated At: {update['updated_at']}")
     
     # Process reimbursement
-    print("\n--- Reimbursement Processing ---")
+    out.append("\n--- Reimbursement Processing ---")
     reimbursement = insurance_agent.process_reimbursement(
         claim_id=claim['claim_id'],
         amount=91.00  # 70% of $130.00
     )
     
-    print(f"Reimbursement successful: {reimbursement['success']}")
-    print(f"Reimbursement ID: {reimbursement['reimbursement_id']}")
-    print(f"Claim ID: {reimbursement['claim_id']}")
-    print(f"Amount: ${reimbursement['amount']:.2f}")
-    print(f"Payment Date: {reimbursement['payment_date']}")
+    out.append(f"Reimbursement successful: {reimbursement['success']}")
+    out.append(f"Reimbursement ID: {reimbursement['reimbursement_id']}")
+    out.append(f"Claim ID: {reimbursement['claim_id']}")
+    out.append(f"Amount: ${reimbursement['amount']:.2f}")
+    out.append(f"Payment Date: {reimbursement['payment_date']}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def demonstrate_integrated_workflow():
     """Demonstrate an integrated workflow between billing and insurance agents"""
-    print("\n=== INTEGRATED WORKFLOW DEMO ===\n")
+    out = []
+    out.append("\n=== INTEGRATED WORKFLOW DEMO ===\n")
     
-    # Initialize agents
-    billing_agent = BillingAgent()
-    insurance_agent = InsuranceReimbursementAgent()
+    # Initialize agents over a shared patient store
+    store = PatientStore()
+    billing_agent = BillingAgent(store=store)
+    insurance_agent = InsuranceReimbursementAgent(store=store)
     
     # Patient and service information
     patient_id = "PT54321"
@@ -577,13 +887,13 @@ def demonstrate_integrated_workflow():
     cpt_code = "90834"  # 45-minute therapy
     
     # Step 1: Calculate service cost
-    print("Step 1: Calculate service cost")
+    out.append("Step 1: Calculate service cost")
     service_cost = billing_agent.calculate_service_cost(cpt_code)
-    print(f"Service: {service_cost['service']}")
-    print(f"Total Cost: ${service_cost['total_cost']:.2f}")
+    out.append(f"Service: {service_cost['service']}")
+    out.append(f"Total Cost: ${service_cost['total_cost']:.2f}")
     
     # Step 2: Verify insurance coverage
-    print("\nStep 2: Verify insurance coverage")
+    out.append("\nStep 2: Verify insurance coverage")
     coverage = insurance_agent.verify_coverage(
         insurance_id=insurance_id,
         provider_code=provider_code,
@@ -593,21 +903,21 @@ def demonstrate_integrated_workflow():
     coverage_percentage = coverage['coverage_percentage']
     patient_responsibility = coverage['estimated_patient_responsibility']
     
-    print(f"Coverage: {coverage_percentage * 100:.1f}%")
-    print(f"Patient Responsibility: {patient_responsibility * 100:.1f}%")
+    out.append(f"Coverage: {coverage_percentage * 100:.1f}%")
+    out.append(f"Patient Responsibility: {patient_responsibility * 100:.1f}%")
     
     # Step 3: Calculate patient portion and insurance portion
-    print("\nStep 3: Calculate payment portions")
+    out.append("\nStep 3: Calculate payment portions")
     total_cost = service_cost['total_cost']
     insurance_portion = total_cost * coverage_percentage
     patient_portion = total_cost * patient_responsibility
     
-    print(f"Total Cost: ${total_cost:.2f}")
-    print(f"Insurance Portion: ${insurance_portion:.2f}")
-    print(f"Patient Portion: ${patient_portion:.2f}")
+    out.append(f"Total Cost: ${total_cost:.2f}")
+    out.append(f"Insurance Portion: ${insurance_portion:.2f}")
+    out.append(f"Patient Portion: ${patient_portion:.2f}")
     
     # Step 4: Process patient payment
-    print("\nStep 4: Process patient payment")
+    out.append("\nStep 4: Process patient payment")
     payment = billing_agent.process_payment(
         patient_id=patient_id,
         amount=patient_portion,
@@ -615,35 +925,35 @@ def demonstrate_integrated_workflow():
         service_details=service_cost
     )
     
-    print(f"Patient Payment: ${payment['amount']:.2f}")
-    print(f"Transaction ID: {payment['transaction_id']}")
+    out.append(f"Patient Payment: ${payment['amount']:.2f}")
+    out.append(f"Transaction ID: {payment['transaction_id']}")
     
     # Step 5: Submit insurance claim
-    print("\nStep 5: Submit insurance claim")
-    patient_info = {
-        "patient_id": patient_id,
-        "name": patient_name,
-        "dob": "1980-03-20"
-    }
+    out.append("\nStep 5: Submit insurance claim")
+    patient_info = PatientInfo(
+        patient_id=patient_id,
+        name=patient_name,
+        dob="1980-03-20"
+    )
     
-    provider_info = {
-        "provider_id": "PROV456",
-        "name": "Dr. Johnson",
-        "npi": "0987654321"
-    }
+    provider_info = ProviderInfo(
+        provider_id="PROV456",
+        name="Dr. Johnson",
+        npi="0987654321"
+    )
     
-    service_info = {
-        "cpt_code": cpt_code,
-        "service_date": "2023-09-20",
-        "diagnosis_code": "F32.1",  # Major depressive disorder
-        "total_cost": total_cost
-    }
+    service_info = ServiceInfo(
+        cpt_code=cpt_code,
+        service_date="2023-09-20",
+        diagnosis_code="F32.1",  # Major depressive disorder
+        total_cost=total_cost
+    )
     
-    insurance_info = {
-        "insurance_id": insurance_id,
-        "provider_code": provider_code,
-        "group_number": "GRP654321"
-    }
+    insurance_info = InsuranceInfo(
+        insurance_id=insurance_id,
+        provider_code=provider_code,
+        group_number="GRP654321"
+    )
     
     claim = insurance_agent.submit_claim(
         patient_info=patient_info,
@@ -652,11 +962,11 @@ def demonstrate_integrated_workflow():
         insurance_info=insurance_info
     )
     
-    print(f"Claim ID: {claim['claim_id']}")
-    print(f"Estimated Reimbursement: ${claim['estimated_reimbursement']:.2f}")
+    out.append(f"Claim ID: {claim['claim_id']}")
+    out.append(f"Estimated Reimbursement: ${claim['estimated_reimbursement']:.2f}")
     
     # Step 6: Update claim status (simulating insurance processing)
-    print("\nStep 6: Update claim status (insurance processing)")
+    out.append("\nStep 6: Update claim status (insurance processing)")
     insurance_agent.update_claim_status(
         claim_id=claim['claim_id'],
         new_status="approved",
@@ -664,33 +974,34 @@ def demonstrate_integrated_workflow():
     )
     
     # Step 7: Process reimbursement
-    print("\nStep 7: Process reimbursement")
+    out.append("\nStep 7: Process reimbursement")
     reimbursement = insurance_agent.process_reimbursement(
         claim_id=claim['claim_id'],
         amount=insurance_portion
     )
     
-    print(f"Reimbursement ID: {reimbursement['reimbursement_id']}")
-    print(f"Reimbursement Amount: ${reimbursement['amount']:.2f}")
+    out.append(f"Reimbursement ID: {reimbursement['reimbursement_id']}")
+    out.append(f"Reimbursement Amount: ${reimbursement['amount']:.2f}")
     
     # Step 8: Generate invoice for record-keeping
-    print("\nStep 8: Generate invoice for record-keeping")
+    out.append("\nStep 8: Generate invoice for record-keeping")
     invoice = billing_agent.generate_invoice(
         patient_id=patient_id,
         services=[service_cost],
         payment_status="paid"
     )
     
-    print(f"Invoice ID: {invoice['invoice_id']}")
-    print(f"Total Amount: ${invoice['total_amount']:.2f}")
-    print(f"Payment Status: {invoice['payment_status']}")
+    out.append(f"Invoice ID: {invoice['invoice_id']}")
+    out.append(f"Total Amount: ${invoice['total_amount']:.2f}")
+    out.append(f"Payment Status: {invoice['payment_status']}")
+    
+    out.append("\n=== WORKFLOW COMPLETE ===")
     
-    print("\n=== WORKFLOW COMPLETE ===")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":
-    print("EneHealths Billing and Insurance Reimbursement Agents Demo")
-    print("=" * 60)
+    sys.stdout.write("EneHealths Billing and Insurance Reimbursement Agents Demo\n" + "=" * 60 + "\n")
     
     demonstrate_billing_agent()
     demonstrate_insurance_agent()
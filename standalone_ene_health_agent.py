@@ -3,49 +3,299 @@
 Standalone EneHealths Agent - No external dependencies required
 """
 
+import re
+import sys
+from collections import deque
+from itertools import islice
+from types import MappingProxyType
+
+# Words in lowercased text; apostrophes split them, so "suicide's" has "suicide"
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _tokenize(lowered):
+    """Get the set of words in lowercased text"""
+    return frozenset(_TOKEN_RE.findall(lowered))
+
+
+class SimpleKeywordMatcher:
+    """Simple keyword matcher for whole words and word stems"""
+    
+    __slots__ = ('keywords', 'words', '_phrase_re')
+    
+    def __init__(self, keywords, stems=()):
+        # Interned so equal keywords compare by identity first
+        stems = tuple(sys.intern(k) for k in stems)
+        self.keywords = tuple(dict.fromkeys((*(sys.intern(k) for k in keywords), *stems)))
+        
+        # Stems only anchor at the start of a word, so "abuse" also finds "abused"
+        stem_set = frozenset(stems)
+        
+        # Whole single words are set lookups; phrases and stems go through one regex
+        self.words = frozenset(
+            k for k in self.keywords if k not in stem_set and _TOKEN_RE.fullmatch(k)
+        )
+        patterns = [
+            re.escape(k) if k in stem_set else re.escape(k) + r"(?!\w)"
+            for k in sorted((k for k in self.keywords if k not in self.words), key=len, reverse=True)
+        ]
+        self._phrase_re = None
+        if patterns:
+            # Lookahead so overlapping matches are all found
+            self._phrase_re = re.compile(f"(?=(?<!\\w)({'|'.join(patterns)}))")
+    
+    def found(self, lowered, tokens=None):
+        """Get the set of keywords in lowercased text"""
+        if tokens is None:
+            tokens = _tokenize(lowered)
+        found = self.words & tokens
+        if self._phrase_re is not None:
+            found = found.union(self._phrase_re.findall(lowered))
+        return found
+    
+    def find(self, lowered, tokens=None):
+        """Get the first listed keyword in lowercased text, or None"""
+        found = self.found(lowered, tokens)
+        if not found:
+            return None
+        return next(k for k in self.keywords if k in found)
+
+
+class SimpleKeywordClassifier:
+    """Simple classifier that picks the highest-priority keyword group in text"""
+    
+    __slots__ = ('groups', '_matcher')
+    
+    def __init__(self, groups):
+        # Groups are (category, keywords, match_stems) triples, highest priority first
+        groups = tuple(groups)
+        self.groups = tuple(
+            (category, tuple(sys.intern(k) for k in keywords))
+            for category, keywords, _ in groups
+        )
+        self._matcher = SimpleKeywordMatcher(
+            [k for _, keywords, match_stems in groups if not match_stems for k in keywords],
+            [k for _, keywords, match_stems in groups if match_stems for k in keywords],
+        )
+    
+    def classify(self, lowered, tokens=None):
+        """Get (category, keyword) for the best match in lowercased text, or (None, None)"""
+        found = self._matcher.found(lowered, tokens)
+        if found:
+            for category, keywords in self.groups:
+                for keyword in keywords:
+                    if keyword in found:
+                        return category, keyword
+        return None, None
+
+
+# Absolute treatment claims that the hallucination detector flags
+_MEDICAL_CLAIMS = (
+    "cure", "guaranteed", "always works", "100% effective",
+    "miracle", "instant relief", "permanent solution"
+)
+_CLAIMS_MATCHER = SimpleKeywordMatcher((), stems=_MEDICAL_CLAIMS)
+_CLAIM_EXPLANATIONS = MappingProxyType({
+    claim: f"The statement contains potentially misleading medical claims like '{claim}'. Mental health treatments vary in effectiveness for different individuals."
+    for claim in _CLAIMS_MATCHER.keywords
+})
+
+
 class SimpleHallucinationDetector:
     """Simple hallucination detector for mental health topics"""
     
+    __slots__ = ('threshold',)
+    
+    # Shared by every detector
+    medical_claims = _CLAIMS_MATCHER.keywords
+    
     def __init__(self, threshold=0.7):
         self.threshold = threshold
-        self.medical_claims = [
-            "cure", "guaranteed", "always works", "100% effective",
-            "miracle", "instant relief", "permanent solution"
-        ]
     
-    def check_hallucination(self, text):
+    def check_hallucination(self, text, lowered=None, tokens=None):
         """Check if text contains potential hallucinations"""
-        text = text.lower()
+        text = text.lower() if lowered is None else lowered
         
         # Check for absolute medical claims
-        for claim in self.medical_claims:
-            if claim in text:
-                return {
-                    "is_hallucination": True,
-                    "explanation": f"The statement contains potentially misleading medical claims like '{claim}'. Mental health treatments vary in effectiveness for different individuals."
-                }
+        claim = _CLAIMS_MATCHER.find(text, tokens)
+        if claim is not None:
+            return self.claim_result(claim)
         
         return {
             "is_hallucination": False,
             "explanation": "No potential hallucinations detected."
         }
+    
+    def claim_result(self, claim):
+        """Get the hallucination result for a medical claim already found in the text"""
+        return {
+            "is_hallucination": True,
+            "explanation": _CLAIM_EXPLANATIONS[claim]
+        }
 
 class SimpleThoughtTracker:
     """Simple thought process tracker"""
     
+    __slots__ = ('thoughts', 'max_history')
+    
     def __init__(self, max_history=10):
-        self.thoughts = []
+        # Oldest thoughts fall off the left once the history is full
+        self.thoughts = deque(maxlen=max_history)
         self.max_history = max_history
     
     def add_thought(self, thought):
         """Add a thought to the history"""
         self.thoughts.append(thought)
-        if len(self.thoughts) > self.max_history:
-            self.thoughts.pop(0)
     
     def get_thoughts(self):
         """Get all thoughts in history"""
-        return self.thoughts
+        return list(self.thoughts)
+    
+    def get_recent_thoughts(self, n):
+        """Get the n most recent thoughts"""
+        if n <= 0:
+            return []
+        return list(islice(self.thoughts, max(0, len(self.thoughts) - n), None))
+
+
+def _freeze(mapping):
+    """Wrap a mapping and any nested mappings in read-only proxies"""
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in mapping.items()
+    })
+
+
+# Configuration shared by every EneHealthsAgent
+_CONFIG = _freeze({
+    'name': 'EneHealths Assistant',
+    'hallucination_threshold': 0.8,
+    'thought_history_size': 15,
+    'sensitive_topics': (
+        'suicide', 'self-harm', 'abuse', 'trauma', 
+        'eating disorders', 'addiction', 'crisis'
+    ),
+    'crisis_keywords': (
+        'kill myself', 'end my life', 'suicide', 'hurt myself',
+        'self-harm', 'die', 'don\'t want to live', 'emergency'
+    ),
+    'support_resources': {
+        'crisis': '988 Suicide & Crisis Lifeline (call or text 988)',
+        'text': 'Text HOME to 741741 to reach Crisis Text Line',
+        'veterans': 'Veterans Crisis Line: 1-800-273-8255 and Press 1',
+        'general': 'SAMHSA\'s National Helpline: 1-800-662-HELP (4357)'
+    }
+})
+
+# Knowledge base shared by every EneHealthsAgent
+_KNOWLEDGE_BASE = _freeze({
+    'organization': {
+        'name': 'EneHealths',
+        'website': 'https://enehealths.org',
+        'mission': 'To provide accessible mental health resources and support to all individuals.',
+        'vision': 'A world where mental health care is accessible, stigma-free, and integrated into everyday life.'
+    },
+    'mental_health_topics': (
+        'anxiety', 'depression', 'stress management', 'trauma',
+        'self-care', 'mindfulness', 'therapy options', 'medication',
+        'crisis support', 'support groups', 'wellness', 'resilience'
+    ),
+    'services': {
+        'counseling': 'Individual and group counseling services',
+        'assessment': 'Mental health assessments and screening',
+        'referrals': 'Referrals to specialized mental health providers',
+        'education': 'Mental health education and workshops',
+        'support_groups': 'Peer support groups for various mental health concerns',
+        'crisis_intervention': 'Crisis intervention and support'
+    },
+    'resources': {
+        'articles': 'Evidence-based articles on mental health topics',
+        'videos': 'Educational videos about mental health',
+        'worksheets': 'Self-help worksheets and exercises',
+        'apps': 'Recommended mental health apps and digital tools',
+        'books': 'Recommended reading on mental health topics',
+        'community': 'Online community forums for peer support'
+    },
+    'faqs': {
+        'what_is_therapy': 'Therapy is a collaborative treatment based on the relationship between an individual and a mental health professional.',
+        'how_to_find_therapist': 'You can find a therapist through your insurance provider, referrals from healthcare providers, or community mental health centers.',
+        'therapy_cost': 'The cost of therapy varies based on location, therapist credentials, and insurance coverage.',
+        'crisis_help': 'If you\'re experiencing a mental health crisis, contact emergency services (911) or call the 988 Suicide & Crisis Lifeline.'
+    }
+})
+
+
+def _build_faq_index(faqs):
+    """Index FAQs by the words their keys require"""
+    answers = []
+    requirements = []
+    index = {}
+    for faq_id, (question, answer) in enumerate(faqs.items()):
+        required = frozenset(question.split('_'))
+        answers.append(answer)
+        requirements.append(required)
+        for word in required:
+            index.setdefault(word, []).append(faq_id)
+    return tuple(answers), tuple(requirements), MappingProxyType(
+        {word: tuple(faq_ids) for word, faq_ids in index.items()}
+    )
+
+
+# Details for topics that have more than the default blurb
+_TOPIC_INFO = MappingProxyType({
+    'anxiety': "Anxiety is a normal emotion that can cause feelings of worry, fear, or tension. When these feelings become excessive, it may be an anxiety disorder. Treatment options include therapy, medication, and self-care practices.",
+    'depression': "Depression is a common but serious mood disorder that causes persistent feelings of sadness and loss of interest. Treatment typically includes therapy, medication, or a combination of both.",
+    'stress management': "Stress management encompasses techniques to cope with and reduce stress. Effective strategies include regular exercise, relaxation techniques, maintaining social connections, and practicing self-care.",
+})
+_TOPIC_DEFAULT_FMT = "EneHealths provides resources, education, and support for individuals dealing with {}."
+
+
+def _noop(thought):
+    """Discard a thought when thought tracing is off"""
+
+
+# Phrases and words that ask about EneHealths itself or its services
+_ABOUT_PHRASES = tuple(map(sys.intern, ('who are you', 'about enehealths', 'what is enehealths')))
+_ABOUT_RE = re.compile("|".join(map(re.escape, _ABOUT_PHRASES)))
+_SERVICE_WORDS = ('services', 'help', 'support', 'offer')
+
+# Matchers and indexes derived from the shared tables; services and topics
+# match as stems so plurals and inflections ("medications", "helping") count
+_SERVICES_MATCHER = SimpleKeywordMatcher((), stems=_SERVICE_WORDS)
+_TOPIC_MATCHER = SimpleKeywordMatcher((), stems=_KNOWLEDGE_BASE['mental_health_topics'])
+
+# Safety checks in the order process_input handles them
+_CRISIS = "crisis"
+_SENSITIVE = "sensitive"
+_CLAIM = "claim"
+# Every safety keyword also matches inflections ("self-harming", "abused", "cures")
+# so a safety reply is never missed
+_SAFETY_CLASSIFIER = SimpleKeywordClassifier((
+    (_CRISIS, _CONFIG['crisis_keywords'], True),
+    (_SENSITIVE, _CONFIG['sensitive_topics'], True),
+    (_CLAIM, _MEDICAL_CLAIMS, True),
+))
+_FAQ_ANSWERS, _FAQ_REQUIREMENTS, _FAQ_INDEX = _build_faq_index(_KNOWLEDGE_BASE['faqs'])
+
+# Responses that only depend on the shared tables
+_CRISIS_RESPONSE = (
+    "I notice you may be experiencing a crisis. Your well-being is important, and immediate support is available.\n\n"
+    "Please consider these resources:\n"
+    + "".join(f"- {resource_info}\n" for resource_info in _CONFIG['support_resources'].values())
+    + "\nIf you're in immediate danger, please call emergency services (911) or go to your nearest emergency room."
+)
+_ORGANIZATION = _KNOWLEDGE_BASE['organization']
+_ABOUT_RESPONSE = (
+    f"{_ORGANIZATION['name']} is a mental health organization dedicated to {_ORGANIZATION['mission']}\n\n"
+    f"Our vision is {_ORGANIZATION['vision']}\n\n"
+    f"You can learn more at {_ORGANIZATION['website']}"
+)
+_MISSION_AND_VISION = (_ORGANIZATION['mission'], _ORGANIZATION['vision'])
+_SERVICES_RESPONSE = "EneHealths offers the following mental health services:\n\n" + "".join(
+    f"- {service.replace('_', ' ').title()}: {description}\n"
+    for service, description in _KNOWLEDGE_BASE['services'].items()
+)
+
 
 class EneHealthsAgent:
     """
@@ -53,7 +303,15 @@ class EneHealthsAgent:
     No external dependencies required.
     """
     
-    def __init__(self):
+    __slots__ = (
+        'config', 'hallucination_detector', 'thought_tracker', '_trace', '_add_thought',
+        'knowledge_base', 'sensitive_topics', 'crisis_keywords', 'support_resources',
+        '_topics', '_safety',
+        '_faq_answers', '_faq_requirements', '_faq_index',
+        '_crisis_response', '_services_response', '_about_response', '_mission_and_vision'
+    )
+    
+    def __init__(self, trace_thoughts=None):
         """Initialize the EneHealths agent"""
         # Load configuration
         self.config = self._load_config()
@@ -67,225 +325,161 @@ class EneHealthsAgent:
             max_history=self.config.get('thought_history_size', 10)
         )
         
+        # Only record thoughts when tracing is on
+        if trace_thoughts is None:
+            trace_thoughts = self.config.get('trace_thoughts', False)
+        self._trace = trace_thoughts
+        self._add_thought = self.thought_tracker.add_thought if trace_thoughts else _noop
+        
         # Load knowledge base
         self.knowledge_base = self._load_knowledge_base()
         
         # Set up sensitive content handling
-        self.sensitive_topics = self.config.get('sensitive_topics', [])
-        self.crisis_keywords = self.config.get('crisis_keywords', [])
+        self.sensitive_topics = self.config.get('sensitive_topics', ())
+        self.crisis_keywords = self.config.get('crisis_keywords', ())
         self.support_resources = self.config.get('support_resources', {})
+        
+        # Matchers and FAQ index are prebuilt from the shared tables
+        self._topics = _TOPIC_MATCHER
+        self._safety = _SAFETY_CLASSIFIER
+        self._faq_answers = _FAQ_ANSWERS
+        self._faq_requirements = _FAQ_REQUIREMENTS
+        self._faq_index = _FAQ_INDEX
+        self._crisis_response = _CRISIS_RESPONSE
+        self._services_response = _SERVICES_RESPONSE
+        self._about_response = _ABOUT_RESPONSE
+        self._mission_and_vision = _MISSION_AND_VISION
     
     def _load_config(self):
         """Load configuration"""
-        return {
-            'name': 'EneHealths Assistant',
-            'hallucination_threshold': 0.8,
-            'thought_history_size': 15,
-            'sensitive_topics': [
-                'suicide', 'self-harm', 'abuse', 'trauma', 
-                'eating disorders', 'addiction', 'crisis'
-            ],
-            'crisis_keywords': [
-                'kill myself', 'end my life', 'suicide', 'hurt myself',
-                'self-harm', 'die', 'don\'t want to live', 'emergency'
-            ],
-            'support_resources': {
-                'crisis': '988 Suicide & Crisis Lifeline (call or text 988)',
-                'text': 'Text HOME to 741741 to reach Crisis Text Line',
-                'veterans': 'Veterans Crisis Line: 1-800-273-8255 and Press 1',
-                'general': 'SAMHSA\'s National Helpline: 1-800-662-HELP (4357)'
-            }
-        }
+        return _CONFIG
     
     def _load_knowledge_base(self):
         """Load knowledge base"""
-        return {
-            'organization': {
-                'name': 'EneHealths',
-                'website': 'https://enehealths.org',
-                'mission': 'To provide accessible mental health resources and support to all individuals.',
-                'vision': 'A world where mental health care is accessible, stigma-free, and integrated into everyday life.'
-            },
-            'mental_health_topics': [
-                'anxiety', 'depression', 'stress management', 'trauma',
-                'self-care', 'mindfulness', 'therapy options', 'medication',
-                'crisis support', 'support groups', 'wellness', 'resilience'
-            ],
-            'services': {
-                'counseling': 'Individual and group counseling services',
-                'assessment': 'Mental health assessments and screening',
-                'referrals': 'Referrals to specialized mental health providers',
-                'education': 'Mental health education and workshops',
-                'support_groups': 'Peer support groups for various mental health concerns',
-                'crisis_intervention': 'Crisis intervention and support'
-            },
-            'resources': {
-                'articles': 'Evidence-based articles on mental health topics',
-                'videos': 'Educational videos about mental health',
-                'worksheets': 'Self-help worksheets and exercises',
-                'apps': 'Recommended mental health apps and digital tools',
-                'books': 'Recommended reading on mental health topics',
-                'community': 'Online community forums for peer support'
-            },
-            'faqs': {
-                'what_is_therapy': 'Therapy is a collaborative treatment based on the relationship between an individual and a mental health professional.',
-                'how_to_find_therapist': 'You can find a therapist through your insurance provider, referrals from healthcare providers, or community mental health centers.',
-                'therapy_cost': 'The cost of therapy varies based on location, therapist credentials, and insurance coverage.',
-                'crisis_help': 'If you\'re experiencing a mental health crisis, contact emergency services (911) or call the 988 Suicide & Crisis Lifeline.'
-            }
-        }
+        return _KNOWLEDGE_BASE
     
     def process_input(self, user_input):
         """Process user input and generate response"""
+        # Every path records up to two thoughts; look these up once
+        add_thought = self._add_thought
+        trace = self._trace
+        
         # Track thought process
-        self.thought_tracker.add_thought(f"Received input: {user_input}")
+        if trace:
+            add_thought(f"Received input: {user_input}")
+        
+        # Lowercase and tokenize once and share them with every check below
+        lowered = user_input.lower()
+        tokens = _tokenize(lowered)
+        
+        # One pass finds crisis, sensitive and hallucination keywords, in that priority
+        category, keyword = self._safety.classify(lowered, tokens)
         
         # Check for crisis or sensitive content
-        if self._is_crisis_situation(user_input):
-            self.thought_tracker.add_thought("Detected crisis situation, providing emergency resources")
+        if category == _CRISIS:
+            add_thought("Detected crisis situation, providing emergency resources")
             return self._handle_crisis_situation()
         
-        if self._contains_sensitive_topic(user_input):
-            self.thought_tracker.add_thought("Detected sensitive topic, providing careful response")
-            return self._handle_sensitive_topic(user_input)
+        if category == _SENSITIVE:
+            add_thought("Detected sensitive topic, providing careful response")
+            return self._handle_sensitive_topic(keyword)
         
         # Check for hallucination risk
-        hallucination_check = self.hallucination_detector.check_hallucination(user_input)
-        if hallucination_check['is_hallucination']:
-            self.thought_tracker.add_thought(f"Potential hallucination detected: {hallucination_check['explanation']}")
+        if category == _CLAIM:
+            hallucination_check = self.hallucination_detector.claim_result(keyword)
+            if trace:
+                add_thought(f"Potential hallucination detected: {hallucination_check['explanation']}")
             return self._handle_hallucination(hallucination_check)
         
         # Process regular input
-        self.thought_tracker.add_thought("Processing regular input")
-        return self._generate_response(user_input)
-    
-    def _is_crisis_situation(self, text):
-        """Check if text indicates a crisis situation"""
-        text = text.lower()
-        for keyword in self.crisis_keywords:
-            if keyword in text:
-                return True
-        return False
-    
-    def _contains_sensitive_topic(self, text):
-        """Check if text contains sensitive topics"""
-        text = text.lower()
-        for topic in self.sensitive_topics:
-            if topic in text:
-                return True
-        return False
+        add_thought("Processing regular input")
+        return self._generate_response(lowered, tokens)
     
     def _handle_crisis_situation(self):
         """Handle crisis situation"""
-        response = "I notice you may be experiencing a crisis. Your well-being is important, and immediate support is available.\n\n"
-        response += "Please consider these resources:\n"
-        
-        for resource_name, resource_info in self.support_resources.items():
-            response += f"- {resource_info}\n"
-            
-        response += "\nIf you're in immediate danger, please call emergency services (911) or go to your nearest emergency room."
-        
-        return response
-    
-    def _handle_sensitive_topic(self, user_input):
-        """Handle sensitive topic"""
-        # Identify which sensitive topic is present
-        topic = None
-        for t in self.sensitive_topics:
-            if t in user_input.lower():
-                topic = t
-                break
-                
+        return self._crisis_response
+    
+    def _handle_sensitive_topic(self, topic):
+        """Handle the sensitive topic found in the input"""
         # Formulate a careful response
-        response = f"I understand you're asking about {topic}, which is an important mental health concern. "
-        response += "I want to provide helpful information while acknowledging that everyone's experience is unique.\n\n"
-        
-        response += "EneHealths offers resources and support for individuals dealing with this issue. "
-        response += "Speaking with a mental health professional can provide personalized support."
-        
-        return response
+        return (
+            f"I understand you're asking about {topic}, which is an important mental health concern. "
+            "I want to provide helpful information while acknowledging that everyone's experience is unique.\n\n"
+            "EneHealths offers resources and support for individuals dealing with this issue. "
+            "Speaking with a mental health professional can provide personalized support."
+        )
     
     def _handle_hallucination(self, hallucination_check):
         """Handle potential hallucination"""
-        response = "I want to make sure I provide accurate information. "
-        response += hallucination_check['explanation'] + " "
-        response += "I can help you find reliable information about mental health topics from EneHealths."
-        
-        return response
+        return (
+            "I want to make sure I provide accurate information. "
+            f"{hallucination_check['explanation']} "
+            "I can help you find reliable information about mental health topics from EneHealths."
+        )
     
-    def _generate_response(self, user_input):
-        """Generate response based on user input"""
-        user_input = user_input.lower()
+    def _generate_response(self, user_input, tokens=None):
+        """Generate response based on lowercased user input"""
+        if tokens is None:
+            tokens = _tokenize(user_input)
         
         # About EneHealths
-        if any(keyword in user_input for keyword in ['who are you', 'about enehealths', 'what is enehealths']):
+        if _ABOUT_RE.search(user_input):
             return self._get_about_response()
             
         # Services information
-        if any(keyword in user_input for keyword in ['services', 'help', 'support', 'offer']):
+        if _SERVICES_MATCHER.found(user_input, tokens):
             return self._get_services_response()
             
         # Mental health topics
-        for topic in self.knowledge_base['mental_health_topics']:
-            if topic in user_input:
-                return self._get_topic_info(topic)
+        topic = self._topics.find(user_input, tokens)
+        if topic is not None:
+            return self._get_topic_info(topic)
                 
         # FAQ responses
-        for question, answer in self.knowledge_base['faqs'].items():
-            keywords = question.split('_')
-            if all(keyword in user_input for keyword in keywords):
-                return answer
+        faq_index = self._faq_index
+        # FAQ words match as stems too, so "therapists" counts for "therapist"
+        faq_words = {
+            token[:end] for token in tokens for end in range(1, len(token) + 1)
+            if token[:end] in faq_index
+        }
+        candidates = {faq_id for word in faq_words for faq_id in faq_index[word]}
+        for faq_id in sorted(candidates):
+            if self._faq_requirements[faq_id] <= faq_words:
+                return self._faq_answers[faq_id]
                 
         # Default response
         return "I'm here to provide information about mental health and EneHealths services. How can I assist you today?"
     
     def _get_about_response(self):
         """Get information about EneHealths"""
-        org = self.knowledge_base['organization']
-        response = f"{org['name']} is a mental health organization dedicated to {org['mission']}\n\n"
-        response += f"Our vision is {org['vision']}\n\n"
-        response += f"You can learn more at {org['website']}"
-        
-        return response
+        return self._about_response
     
     def _get_services_response(self):
         """Get information about EneHealths services"""
-        response = "EneHealths offers the following mental health services:\n\n"
-        
-        for service, description in self.knowledge_base['services'].items():
-            response += f"- {service.replace('_', ' ').title()}: {description}\n"
-            
-        return response
+        return self._services_response
     
     def _get_topic_info(self, topic):
         """Get information about a specific mental health topic"""
-        response = f"Information about {topic}:\n\n"
-        
-        if topic == 'anxiety':
-            response += "Anxiety is a normal emotion that can cause feelings of worry, fear, or tension. When these feelings become excessive, it may be an anxiety disorder. Treatment options include therapy, medication, and self-care practices."
-        elif topic == 'depression':
-            response += "Depression is a common but serious mood disorder that causes persistent feelings of sadness and loss of interest. Treatment typically includes therapy, medication, or a combination of both."
-        elif topic == 'stress management':
-            response += "Stress management encompasses techniques to cope with and reduce stress. Effective strategies include regular exercise, relaxation techniques, maintaining social connections, and practicing self-care."
-        else:
-            response += f"EneHealths provides resources, education, and support for individuals dealing with {topic}."
-            
-        return response
+        info = _TOPIC_INFO.get(topic) or _TOPIC_DEFAULT_FMT.format(topic)
+        return f"Information about {topic}:\n\n{info}"
     
     def get_thought_history(self):
         """Get thought process history"""
         return self.thought_tracker.get_thoughts()
     
+    def get_recent_thoughts(self, n):
+        """Get the n most recent thoughts from the history"""
+        return self.thought_tracker.get_recent_thoughts(n)
+    
     def get_mission_and_vision(self):
         """Get EneHealths mission and vision"""
-        org = self.knowledge_base['organization']
-        return org['mission'], org['vision']
+        return self._mission_and_vision
 
 
 def main():
     """Main function to demonstrate EneHealths agent"""
     print("Initializing EneHealths Agent...")
-    agent = EneHealthsAgent()
+    agent = EneHealthsAgent(trace_thoughts=True)
     
     # Print mission and vision
     print("\n=== EneHealths Mission and Vision ===")
@@ -310,9 +504,8 @@ def main():
         
         # Show thought process for this scenario
         print("\nThought Process:")
-        thoughts = agent.get_thought_history()
         # Show only the last 3 thoughts related to this scenario
-        for thought in thoughts[-3:]:
+        for thought in agent.get_recent_thoughts(3):
             print(f"- {thought}")
         
         print("\n" + "-"*50)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test script for the standalone EneHealths agent keyword matching
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from standalone_ene_health_agent import EneHealthsAgent
+
+CRISIS_MARKER = "I notice you may be experiencing a crisis"
+SENSITIVE_MARKER = "which is an important mental health concern"
+
+def test_crisis_inflections():
+    """Test that inflected, possessive and quoted crisis keywords are detected."""
+    print("Testing crisis keyword forms...")
+    agent = EneHealthsAgent()
+    
+    for text in [
+        "I've been self-harming again",
+        "I want to 'die'",
+        "thinking about suicide's pull",
+        "I want to kill myself",
+    ]:
+        response = agent.process_input(text)
+        assert response.startswith(CRISIS_MARKER), f"Should give crisis response for {text!r}"
+    print("✓ Crisis keyword forms detected")
+
+def test_sensitive_inflections():
+    """Test that inflected sensitive topics are detected and named."""
+    print("\nTesting sensitive topic forms...")
+    agent = EneHealthsAgent()
+    
+    for text, topic in [
+        ("I was abused as a child", "abuse"),
+        ("I feel traumatized", "trauma"),
+        ("my addictions are bad", "addiction"),
+    ]:
+        response = agent.process_input(text)
+        assert SENSITIVE_MARKER in response, f"Should give sensitive response for {text!r}"
+        assert f"asking about {topic}," in response, f"Should name {topic!r} for {text!r}"
+    print("✓ Sensitive topic forms detected")
+
+def test_claim_inflections():
+    """Test that inflected medical claims are flagged as potential hallucinations."""
+    print("\nTesting medical claim forms...")
+    agent = EneHealthsAgent()
+    
+    for text, claim in [
+        ("This treatment cures depression", "cure"),
+        ("This is a cured disease", "cure"),
+        ("These pills are miracles", "miracle"),
+    ]:
+        response = agent.process_input(text)
+        assert f"misleading medical claims like '{claim}'" in response, f"Should flag {claim!r} in {text!r}"
+    print("✓ Medical claim forms flagged")
+
+def test_topic_and_service_inflections():
+    """Test that plural topics and inflected service words get their replies."""
+    print("\nTesting topic and service forms...")
+    agent = EneHealthsAgent()
+    
+    response = agent.process_input("medications?")
+    assert response.startswith("Information about medication:"), "Plural topic should get topic info"
+    
+    response = agent.process_input("Is anyone helping people here?")
+    assert response.startswith("EneHealths offers the following"), "'helping' should get the services reply"
+    
+    response = agent.process_input("how to find therapists")
+    assert response.startswith("You can find a therapist"), "Plural FAQ word should get the FAQ answer"
+    print("✓ Topic and service forms matched")
+
+def test_word_boundaries():
+    """Test that keywords inside other words and possessive topics are handled."""
+    print("\nTesting word boundaries...")
+    agent = EneHealthsAgent()
+    
+    response = agent.process_input("I studied hard today")
+    assert not response.startswith(CRISIS_MARKER), "'studied' should not match 'die'"
+    
+    response = agent.process_input("I feel secure today")
+    assert "misleading medical claims" not in response, "'secure' should not match the 'cure' claim"
+    
+    response = agent.process_input("depression's grip")
+    assert response.startswith("Information about depression:"), "Possessive topic should get topic info"
+    print("✓ Word boundaries respected")
+
+def main():
+    """Run all tests."""
+    print("="*50)
+    print("TESTING STANDALONE ENEHEALTHS AGENT")
+    print("="*50)
+    
+    try:
+        test_crisis_inflections()
+        test_sensitive_inflections()
+        test_claim_inflections()
+        test_topic_and_service_inflections()
+        test_word_boundaries()
+        
+        print("\n" + "="*50)
+        print("✓ ALL TESTS PASSED")
+        print("="*50)
+    except AssertionError as e:
+        print(f"\n❌ TEST FAILED: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()